@@ -0,0 +1,80 @@
+using Microsoft.Data.Sqlite;
+using XmlIndexer.Analysis;
+using XmlIndexer.Database;
+
+namespace XmlIndexer.Tests.Analysis;
+
+/// <summary>
+/// Tests for HarmonyConflictDetector - json_group_array list reading and collision detection.
+/// </summary>
+public class HarmonyConflictDetectorTests : IDisposable
+{
+    private readonly SqliteConnection _db;
+
+    public HarmonyConflictDetectorTests()
+    {
+        _db = new SqliteConnection("Data Source=:memory:");
+        _db.Open();
+        DatabaseBuilder.CreateSchema(_db);
+    }
+
+    public void Dispose()
+    {
+        _db.Close();
+        _db.Dispose();
+    }
+
+    // ==========================================================================
+    // ReadJsonList
+    // ==========================================================================
+
+    [Fact]
+    public void ReadJsonList_KeepsCommasAndDropsNulls()
+    {
+        var list = ReadList(@"
+            SELECT json_group_array(v) FROM (
+                SELECT 'Mod, A' AS v UNION ALL SELECT NULL UNION ALL SELECT 'int,string')");
+
+        Assert.Equal(new[] { "Mod, A", "int,string" }, list);
+    }
+
+    [Fact]
+    public void ReadJsonList_NullColumnIsEmpty()
+    {
+        Assert.Empty(ReadList("SELECT NULL"));
+    }
+
+    private List<string> ReadList(string sql)
+    {
+        using var cmd = _db.CreateCommand();
+        cmd.CommandText = sql;
+        using var reader = cmd.ExecuteReader();
+        Assert.True(reader.Read());
+        return HarmonyConflictDetector.ReadJsonList(reader, 0);
+    }
+
+    // ==========================================================================
+    // Patch Collisions
+    // ==========================================================================
+
+    [Fact]
+    public void DetectPatchCollisions_ModNameWithCommaIsOneMod()
+    {
+        using (var cmd = _db.CreateCommand())
+        {
+            cmd.CommandText = @"
+                INSERT INTO mods (id, name) VALUES (1, 'Mod, A'), (2, 'ModB');
+                INSERT INTO harmony_patches (mod_id, patch_class, target_class, target_method, patch_type, target_arg_types)
+                VALUES (1, 'PatchA', 'EntityPlayer', 'Update', 'Prefix', NULL),
+                       (2, 'PatchB', 'EntityPlayer', 'Update', 'Postfix', 'int,string');";
+            cmd.ExecuteNonQuery();
+        }
+
+        var collision = Assert.Single(HarmonyConflictDetector.DetectPatchCollisions(_db));
+
+        Assert.Equal(2, collision.ModCount);
+        Assert.Equal(2, collision.Mods.Count);
+        Assert.Contains("Mod, A", collision.Mods);
+        Assert.Contains("ModB", collision.Mods);
+    }
+}
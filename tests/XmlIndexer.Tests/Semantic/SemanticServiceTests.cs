@@ -0,0 +1,100 @@
+using System.Text;
+using System.Text.Json;
+using XmlIndexer.Models;
+using XmlIndexer.Semantic;
+
+namespace XmlIndexer.Tests.Semantic;
+
+/// <summary>
+/// Tests for SemanticService - JSONL trace export and mapping import parsing.
+/// </summary>
+public class SemanticServiceTests
+{
+    // ==========================================================================
+    // Export -> Import Round Trip
+    // ==========================================================================
+
+    /// <summary>
+    /// Every exported line must be a standalone JSON object the importer can read back.
+    /// </summary>
+    [Fact]
+    public void WriteTraceLines_EachLineParsesBack()
+    {
+        var traces = new[]
+        {
+            new SemanticTrace("property_name", "DegradationMax", "item", "code", null, null, "Items"),
+            new SemanticTrace("definition", "gunPistol", "item", "code", "usage", "ammo9mm", null),
+            new SemanticTrace("definition", "Zombie Café", null, "code", null, null, "Entities")
+        };
+
+        using var stream = new MemoryStream();
+        var written = SemanticService.WriteTraceLines(stream, traces);
+
+        var lines = Encoding.UTF8.GetString(stream.ToArray())
+            .Split('\n', StringSplitOptions.RemoveEmptyEntries);
+
+        Assert.Equal(traces.Length, written);
+        Assert.Equal(traces.Length, lines.Length);
+        for (int i = 0; i < traces.Length; i++)
+        {
+            Assert.StartsWith("{", lines[i]);
+
+            var mapping = SemanticService.ParseMappingJson(lines[i]);
+            Assert.NotNull(mapping);
+            Assert.Equal(traces[i].EntityType, mapping.Value.type);
+            Assert.Equal(traces[i].EntityName, mapping.Value.name);
+            Assert.Equal(traces[i].ParentContext, mapping.Value.parent);
+            Assert.Null(mapping.Value.layman);
+        }
+    }
+
+    // ==========================================================================
+    // ParseMappingJson
+    // ==========================================================================
+
+    [Fact]
+    public void ParseMappingJson_DecodesEscapes()
+    {
+        var line = "{\"entity_type\":\"property_name\",\"entity_name\":\"Caf\\u00e9\"," +
+                   "\"layman_description\":\"Line one\\tTabbed\\nLine two \\\"quoted\\\"\"}";
+
+        var mapping = SemanticService.ParseMappingJson(line);
+
+        Assert.NotNull(mapping);
+        Assert.Equal("Café", mapping.Value.name);
+        Assert.Equal("Line one\tTabbed\nLine two \"quoted\"", mapping.Value.layman);
+    }
+
+    [Fact]
+    public void ParseMappingJson_NullAndNonStringValuesReadAsNull()
+    {
+        var line = "{\"entity_type\":\"definition\",\"entity_name\":\"gunPistol\",\"parent_context\":null," +
+                   "\"code_trace\":{\"nested\":\"layman_description\"},\"confidence\":0.9," +
+                   "\"layman_description\":\"A pistol\",\"llm_model\":null}";
+
+        var mapping = SemanticService.ParseMappingJson(line);
+
+        Assert.NotNull(mapping);
+        Assert.Null(mapping.Value.parent);
+        Assert.Equal("A pistol", mapping.Value.layman);
+        Assert.Null(mapping.Value.technical);
+        Assert.Null(mapping.Value.model);
+    }
+
+    [Fact]
+    public void ParseMappingJson_MissingKeyFieldsReturnsNull()
+    {
+        Assert.Null(SemanticService.ParseMappingJson("{\"entity_type\":\"definition\",\"entity_name\":null}"));
+        Assert.Null(SemanticService.ParseMappingJson("[\"entity_type\",\"entity_name\"]"));
+    }
+
+    [Theory]
+    [InlineData(",{\"entity_type\":\"definition\",\"entity_name\":\"gunPistol\"}")]
+    [InlineData("{\"entity_type\":\"definition\",\"entity_name\":\"gunPistol\"")]
+    [InlineData("not json")]
+    public void ParseMappingJson_MalformedLineThrows(string line)
+    {
+        // ImportSemanticMappings catches this and counts the line as skipped
+        Assert.ThrowsAny<JsonException>(() => SemanticService.ParseMappingJson(line));
+    }
+}
@@ -14,6 +14,12 @@ public class CallExtractor
     private readonly IReadOnlyDictionary<string, long> _signatureToMethodId;
     private readonly bool _verbose;
     
+    // The same callee is hit from many call sites; resolve each symbol once.
+    // Misses (external methods) are cached as null so they skip the signature fallback.
+    private readonly Dictionary<IMethodSymbol, long?> _methodIdCache = new(SymbolEqualityComparer.Default);
+    private readonly Dictionary<IMethodSymbol, (string? Assembly, string Type, string Signature)> _externalTargetCache =
+        new(SymbolEqualityComparer.Default);
+    
     private int _callCount = 0;
     private int _externalCallCount = 0;
     private int _unresolvedCount = 0;
@@ -296,26 +302,38 @@ public class CallExtractor
         var containingType = methodSymbol.ContainingType;
         if (containingType == null) return;
         
-        // Get assembly name
-        string? assemblyName = null;
-        if (containingType.ContainingAssembly != null)
+        if (!_externalTargetCache.TryGetValue(methodSymbol, out var target))
         {
-            assemblyName = containingType.ContainingAssembly.Name;
+            // Get assembly name
+            string? assemblyName = null;
+            if (containingType.ContainingAssembly != null)
+            {
+                assemblyName = containingType.ContainingAssembly.Name;
+            }
+            
+            target = (assemblyName, containingType.ToDisplayString(), BuildSignature(methodSymbol));
+            _externalTargetCache[methodSymbol] = target;
         }
         
-        var targetType = containingType.ToDisplayString();
-        var targetMethod = methodSymbol.Name;
-        var targetSignature = BuildSignature(methodSymbol);
-        
-        db.InsertExternalCall(callerId, assemblyName, targetType, targetMethod, 
-                             targetSignature, filePath, lineNumber);
+        db.InsertExternalCall(callerId, target.Assembly, target.Type, methodSymbol.Name, 
+                             target.Signature, filePath, lineNumber);
         _externalCallCount++;
     }
     
     /// <summary>
-    /// Look up method ID from symbol.
+    /// Look up method ID from symbol (memoized per symbol).
     /// </summary>
     private long? GetMethodId(IMethodSymbol symbol)
+    {
+        if (!_methodIdCache.TryGetValue(symbol, out var id))
+        {
+            id = ResolveMethodId(symbol);
+            _methodIdCache[symbol] = id;
+        }
+        return id;
+    }
+    
+    private long? ResolveMethodId(IMethodSymbol symbol)
     {
         // Try direct symbol lookup first
         if (_symbolToId.TryGetValue(symbol, out var id))
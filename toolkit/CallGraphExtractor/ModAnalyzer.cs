@@ -8,7 +8,7 @@ namespace CallGraphExtractor;
 /// Automated QA Analyzer for 7D2D mods.
 /// Discovers all functionality, analyzes interactions, traces flows, and identifies gaps.
 /// </summary>
-public class ModAnalyzer
+public class ModAnalyzer : IDisposable
 {
     private readonly SqliteConnection _conn;
     private readonly bool _verbose;
@@ -997,6 +997,11 @@ public class ModAnalyzer
         
         return sb.ToString();
     }
+    
+    public void Dispose()
+    {
+        _conn.Dispose();
+    }
 }
 
 // ============================================================================
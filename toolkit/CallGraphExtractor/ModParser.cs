@@ -389,12 +389,12 @@ public class ModParser
             return true;
         
         // Has C# files
-        if (Directory.GetFiles(path, "*.cs", SearchOption.AllDirectories).Any())
+        if (Directory.EnumerateFiles(path, "*.cs", SearchOption.AllDirectories).Any())
             return true;
         
         // Has Config directory with XML files
         var configDir = Path.Combine(path, "Config");
-        if (Directory.Exists(configDir) && Directory.GetFiles(configDir, "*.xml").Any())
+        if (Directory.Exists(configDir) && Directory.EnumerateFiles(configDir, "*.xml").Any())
             return true;
         
         return false;
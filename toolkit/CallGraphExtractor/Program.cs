@@ -318,10 +318,10 @@ class Program
     {
         if (File.Exists(Path.Combine(path, "ModInfo.xml")))
             return true;
-        if (Directory.GetFiles(path, "*.cs", SearchOption.AllDirectories).Any())
+        if (Directory.EnumerateFiles(path, "*.cs", SearchOption.AllDirectories).Any())
             return true;
         var configDir = Path.Combine(path, "Config");
-        if (Directory.Exists(configDir) && Directory.GetFiles(configDir, "*.xml").Any())
+        if (Directory.Exists(configDir) && Directory.EnumerateFiles(configDir, "*.xml").Any())
             return true;
         return false;
     }
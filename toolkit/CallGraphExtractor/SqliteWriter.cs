@@ -1,3 +1,4 @@
+using System.Text.RegularExpressions;
 using Microsoft.Data.Sqlite;
 
 namespace CallGraphExtractor;
@@ -11,6 +12,10 @@ public class SqliteWriter : IDisposable
     private readonly string _dbPath;
     private bool _disposed;
     
+    // Insert commands are prepared once and rebound per row (keyed by SQL text)
+    private readonly Dictionary<string, SqliteCommand> _commands = new();
+    private SqliteTransaction? _transaction;
+    
     public SqliteWriter(string dbPath)
     {
         _dbPath = dbPath;
@@ -23,6 +28,16 @@ public class SqliteWriter : IDisposable
     public void Initialize()
     {
         _connection.Open();
+        
+        // NORMAL sync: bulk inserts don't fsync on every commit. The journal stays the
+        // default rollback journal - WAL mode persists in the file and would make
+        // every reader of the shipped database need write access for -wal/-shm.
+        using (var pragma = _connection.CreateCommand())
+        {
+            pragma.CommandText = "PRAGMA synchronous=NORMAL;";
+            pragma.ExecuteNonQuery();
+        }
+        
         CreateSchema();
     }
     
@@ -72,12 +87,11 @@ public class SqliteWriter : IDisposable
     
     public void SetMetadata(string key, string value)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT OR REPLACE INTO metadata (key, value) VALUES (@key, @value)
-        ";
-        cmd.Parameters.AddWithValue("@key", key);
-        cmd.Parameters.AddWithValue("@value", value);
+        ");
+        cmd.Parameters["@key"].Value = key;
+        cmd.Parameters["@value"].Value = value;
         cmd.ExecuteNonQuery();
     }
     
@@ -89,8 +103,7 @@ public class SqliteWriter : IDisposable
                            string? baseType, string? assembly, string? filePath, int? lineNumber,
                            bool isAbstract = false, bool isSealed = false, bool isStatic = false)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO types (name, namespace, full_name, kind, base_type, assembly, file_path, line_number,
                               is_abstract, is_sealed, is_static)
             VALUES (@name, @namespace, @full_name, @kind, @base_type, @assembly, @file_path, @line_number,
@@ -100,19 +113,19 @@ public class SqliteWriter : IDisposable
                 file_path = COALESCE(file_path, @file_path),
                 line_number = COALESCE(line_number, @line_number)
             RETURNING id
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@name", name);
-        cmd.Parameters.AddWithValue("@namespace", @namespace ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@full_name", fullName);
-        cmd.Parameters.AddWithValue("@kind", kind);
-        cmd.Parameters.AddWithValue("@base_type", baseType ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@assembly", assembly ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@file_path", filePath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@is_abstract", isAbstract ? 1 : 0);
-        cmd.Parameters.AddWithValue("@is_sealed", isSealed ? 1 : 0);
-        cmd.Parameters.AddWithValue("@is_static", isStatic ? 1 : 0);
+        cmd.Parameters["@name"].Value = name;
+        cmd.Parameters["@namespace"].Value = @namespace ?? (object)DBNull.Value;
+        cmd.Parameters["@full_name"].Value = fullName;
+        cmd.Parameters["@kind"].Value = kind;
+        cmd.Parameters["@base_type"].Value = baseType ?? (object)DBNull.Value;
+        cmd.Parameters["@assembly"].Value = assembly ?? (object)DBNull.Value;
+        cmd.Parameters["@file_path"].Value = filePath ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
+        cmd.Parameters["@is_abstract"].Value = isAbstract ? 1 : 0;
+        cmd.Parameters["@is_sealed"].Value = isSealed ? 1 : 0;
+        cmd.Parameters["@is_static"].Value = isStatic ? 1 : 0;
         
         return (long)cmd.ExecuteScalar()!;
     }
@@ -127,28 +140,27 @@ public class SqliteWriter : IDisposable
                              bool isOverride = false, bool isAbstract = false,
                              string? access = null)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO methods (type_id, name, signature, return_type, assembly, file_path, line_number,
                                 end_line, is_static, is_virtual, is_override, is_abstract, access)
             VALUES (@type_id, @name, @signature, @return_type, @assembly, @file_path, @line_number,
                     @end_line, @is_static, @is_virtual, @is_override, @is_abstract, @access)
             RETURNING id
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@type_id", typeId);
-        cmd.Parameters.AddWithValue("@name", name);
-        cmd.Parameters.AddWithValue("@signature", signature);
-        cmd.Parameters.AddWithValue("@return_type", returnType ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@assembly", assembly ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@file_path", filePath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@end_line", endLine ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@is_static", isStatic ? 1 : 0);
-        cmd.Parameters.AddWithValue("@is_virtual", isVirtual ? 1 : 0);
-        cmd.Parameters.AddWithValue("@is_override", isOverride ? 1 : 0);
-        cmd.Parameters.AddWithValue("@is_abstract", isAbstract ? 1 : 0);
-        cmd.Parameters.AddWithValue("@access", access ?? (object)DBNull.Value);
+        cmd.Parameters["@type_id"].Value = typeId;
+        cmd.Parameters["@name"].Value = name;
+        cmd.Parameters["@signature"].Value = signature;
+        cmd.Parameters["@return_type"].Value = returnType ?? (object)DBNull.Value;
+        cmd.Parameters["@assembly"].Value = assembly ?? (object)DBNull.Value;
+        cmd.Parameters["@file_path"].Value = filePath ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
+        cmd.Parameters["@end_line"].Value = endLine ?? (object)DBNull.Value;
+        cmd.Parameters["@is_static"].Value = isStatic ? 1 : 0;
+        cmd.Parameters["@is_virtual"].Value = isVirtual ? 1 : 0;
+        cmd.Parameters["@is_override"].Value = isOverride ? 1 : 0;
+        cmd.Parameters["@is_abstract"].Value = isAbstract ? 1 : 0;
+        cmd.Parameters["@access"].Value = access ?? (object)DBNull.Value;
         
         return (long)cmd.ExecuteScalar()!;
     }
@@ -158,12 +170,11 @@ public class SqliteWriter : IDisposable
     /// </summary>
     public void InsertMethodBody(long methodId, string body)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO method_bodies (method_id, body) VALUES (@method_id, @body)
-        ";
-        cmd.Parameters.AddWithValue("@method_id", methodId.ToString());
-        cmd.Parameters.AddWithValue("@body", body);
+        ");
+        cmd.Parameters["@method_id"].Value = methodId.ToString();
+        cmd.Parameters["@body"].Value = body;
         cmd.ExecuteNonQuery();
     }
     
@@ -174,17 +185,16 @@ public class SqliteWriter : IDisposable
     public void InsertCall(long callerId, long calleeId, string? filePath, int? lineNumber,
                            string callType = "direct")
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO calls (caller_id, callee_id, file_path, line_number, call_type)
             VALUES (@caller_id, @callee_id, @file_path, @line_number, @call_type)
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@caller_id", callerId);
-        cmd.Parameters.AddWithValue("@callee_id", calleeId);
-        cmd.Parameters.AddWithValue("@file_path", filePath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@call_type", callType);
+        cmd.Parameters["@caller_id"].Value = callerId;
+        cmd.Parameters["@callee_id"].Value = calleeId;
+        cmd.Parameters["@file_path"].Value = filePath ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
+        cmd.Parameters["@call_type"].Value = callType;
         cmd.ExecuteNonQuery();
     }
     
@@ -196,21 +206,20 @@ public class SqliteWriter : IDisposable
                                    string targetMethod, string? targetSignature,
                                    string? filePath, int? lineNumber)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO external_calls (caller_id, target_assembly, target_type, target_method, 
                                        target_signature, file_path, line_number)
             VALUES (@caller_id, @target_assembly, @target_type, @target_method, 
                     @target_signature, @file_path, @line_number)
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@caller_id", callerId);
-        cmd.Parameters.AddWithValue("@target_assembly", targetAssembly ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@target_type", targetType);
-        cmd.Parameters.AddWithValue("@target_method", targetMethod);
-        cmd.Parameters.AddWithValue("@target_signature", targetSignature ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@file_path", filePath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
+        cmd.Parameters["@caller_id"].Value = callerId;
+        cmd.Parameters["@target_assembly"].Value = targetAssembly ?? (object)DBNull.Value;
+        cmd.Parameters["@target_type"].Value = targetType;
+        cmd.Parameters["@target_method"].Value = targetMethod;
+        cmd.Parameters["@target_signature"].Value = targetSignature ?? (object)DBNull.Value;
+        cmd.Parameters["@file_path"].Value = filePath ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
         cmd.ExecuteNonQuery();
     }
     
@@ -220,13 +229,12 @@ public class SqliteWriter : IDisposable
     
     public void InsertImplements(long typeId, string interfaceName)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO implements (type_id, interface_name)
             VALUES (@type_id, @interface_name)
-        ";
-        cmd.Parameters.AddWithValue("@type_id", typeId);
-        cmd.Parameters.AddWithValue("@interface_name", interfaceName);
+        ");
+        cmd.Parameters["@type_id"].Value = typeId;
+        cmd.Parameters["@interface_name"].Value = interfaceName;
         cmd.ExecuteNonQuery();
     }
     
@@ -236,9 +244,35 @@ public class SqliteWriter : IDisposable
     
     public SqliteTransaction BeginTransaction()
     {
-        return _connection.BeginTransaction();
+        _transaction = _connection.BeginTransaction();
+        return _transaction;
     }
     
+    /// <summary>
+    /// Get the cached command for this SQL, creating it and one parameter per
+    /// @name in the SQL on first use. Callers only assign each parameter's Value per row.
+    /// </summary>
+    private SqliteCommand GetCommand(string sql)
+    {
+        if (!_commands.TryGetValue(sql, out var cmd))
+        {
+            cmd = _connection.CreateCommand();
+            cmd.CommandText = sql;
+            foreach (Match name in ParameterPattern.Matches(sql))
+            {
+                if (!cmd.Parameters.Contains(name.Value))
+                    cmd.Parameters.AddWithValue(name.Value, DBNull.Value);
+            }
+            _commands[sql] = cmd;
+        }
+        
+        // Cached commands outlive transactions; a completed one has no connection
+        cmd.Transaction = _transaction?.Connection != null ? _transaction : null;
+        return cmd;
+    }
+    
+    private static readonly Regex ParameterPattern = new(@"@\w+", RegexOptions.Compiled);
+    
     // =========================================================================
     // XML Definition writing
     // =========================================================================
@@ -247,22 +281,21 @@ public class SqliteWriter : IDisposable
                                     string elementXpath, string? propertyName, string? propertyValue,
                                     string? propertyClass, int? lineNumber)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO xml_definitions (file_name, element_type, element_name, element_xpath,
                                          property_name, property_value, property_class, line_number)
             VALUES (@file_name, @element_type, @element_name, @element_xpath,
                     @property_name, @property_value, @property_class, @line_number)
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@file_name", fileName);
-        cmd.Parameters.AddWithValue("@element_type", elementType);
-        cmd.Parameters.AddWithValue("@element_name", elementName ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@element_xpath", elementXpath);
-        cmd.Parameters.AddWithValue("@property_name", propertyName ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@property_value", propertyValue ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@property_class", propertyClass ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
+        cmd.Parameters["@file_name"].Value = fileName;
+        cmd.Parameters["@element_type"].Value = elementType;
+        cmd.Parameters["@element_name"].Value = elementName ?? (object)DBNull.Value;
+        cmd.Parameters["@element_xpath"].Value = elementXpath;
+        cmd.Parameters["@property_name"].Value = propertyName ?? (object)DBNull.Value;
+        cmd.Parameters["@property_value"].Value = propertyValue ?? (object)DBNull.Value;
+        cmd.Parameters["@property_class"].Value = propertyClass ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
         cmd.ExecuteNonQuery();
     }
     
@@ -273,17 +306,16 @@ public class SqliteWriter : IDisposable
     public void InsertXmlPropertyAccess(long methodId, string propertyName, string accessMethod,
                                         string? filePath, int? lineNumber)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO xml_property_access (method_id, property_name, access_method, file_path, line_number)
             VALUES (@method_id, @property_name, @access_method, @file_path, @line_number)
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@method_id", methodId);
-        cmd.Parameters.AddWithValue("@property_name", propertyName);
-        cmd.Parameters.AddWithValue("@access_method", accessMethod);
-        cmd.Parameters.AddWithValue("@file_path", filePath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
+        cmd.Parameters["@method_id"].Value = methodId;
+        cmd.Parameters["@property_name"].Value = propertyName;
+        cmd.Parameters["@access_method"].Value = accessMethod;
+        cmd.Parameters["@file_path"].Value = filePath ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
         cmd.ExecuteNonQuery();
     }
     
@@ -293,8 +325,7 @@ public class SqliteWriter : IDisposable
     
     public long InsertMod(string modName, string? modPath, string? version, string? author)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO mods (name, mod_path, version, author, analyzed_at)
             VALUES (@name, @mod_path, @version, @author, @analyzed_at)
             ON CONFLICT(name) DO UPDATE SET
@@ -303,13 +334,13 @@ public class SqliteWriter : IDisposable
                 author = COALESCE(author, @author),
                 analyzed_at = @analyzed_at
             RETURNING id
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@name", modName);
-        cmd.Parameters.AddWithValue("@mod_path", modPath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@version", version ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@author", author ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@analyzed_at", DateTime.UtcNow.ToString("o"));
+        cmd.Parameters["@name"].Value = modName;
+        cmd.Parameters["@mod_path"].Value = modPath ?? (object)DBNull.Value;
+        cmd.Parameters["@version"].Value = version ?? (object)DBNull.Value;
+        cmd.Parameters["@author"].Value = author ?? (object)DBNull.Value;
+        cmd.Parameters["@analyzed_at"].Value = DateTime.UtcNow.ToString("o");
         
         return (long)cmd.ExecuteScalar()!;
     }
@@ -317,21 +348,20 @@ public class SqliteWriter : IDisposable
     public long InsertModType(long modId, string name, string? @namespace, string fullName, 
                               string kind, string? baseType, string? filePath, int? lineNumber)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO mod_types (mod_id, name, namespace, full_name, kind, base_type, file_path, line_number)
             VALUES (@mod_id, @name, @namespace, @full_name, @kind, @base_type, @file_path, @line_number)
             RETURNING id
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@mod_id", modId);
-        cmd.Parameters.AddWithValue("@name", name);
-        cmd.Parameters.AddWithValue("@namespace", @namespace ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@full_name", fullName);
-        cmd.Parameters.AddWithValue("@kind", kind);
-        cmd.Parameters.AddWithValue("@base_type", baseType ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@file_path", filePath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
+        cmd.Parameters["@mod_id"].Value = modId;
+        cmd.Parameters["@name"].Value = name;
+        cmd.Parameters["@namespace"].Value = @namespace ?? (object)DBNull.Value;
+        cmd.Parameters["@full_name"].Value = fullName;
+        cmd.Parameters["@kind"].Value = kind;
+        cmd.Parameters["@base_type"].Value = baseType ?? (object)DBNull.Value;
+        cmd.Parameters["@file_path"].Value = filePath ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
         
         return (long)cmd.ExecuteScalar()!;
     }
@@ -340,68 +370,70 @@ public class SqliteWriter : IDisposable
                                 string? filePath, int? lineNumber, int? endLine,
                                 bool isStatic = false, string? access = null)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO mod_methods (mod_type_id, name, signature, return_type, file_path, line_number, end_line)
             VALUES (@mod_type_id, @name, @signature, @return_type, @file_path, @line_number, @end_line)
             RETURNING id
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@mod_type_id", modTypeId);
-        cmd.Parameters.AddWithValue("@name", name);
-        cmd.Parameters.AddWithValue("@signature", signature);
-        cmd.Parameters.AddWithValue("@return_type", returnType ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@file_path", filePath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@end_line", endLine ?? (object)DBNull.Value);
+        cmd.Parameters["@mod_type_id"].Value = modTypeId;
+        cmd.Parameters["@name"].Value = name;
+        cmd.Parameters["@signature"].Value = signature;
+        cmd.Parameters["@return_type"].Value = returnType ?? (object)DBNull.Value;
+        cmd.Parameters["@file_path"].Value = filePath ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
+        cmd.Parameters["@end_line"].Value = endLine ?? (object)DBNull.Value;
         
         return (long)cmd.ExecuteScalar()!;
     }
     
     public void InsertModMethodBody(long modMethodId, string body)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO mod_method_bodies (mod_method_id, body) VALUES (@mod_method_id, @body)
-        ";
-        cmd.Parameters.AddWithValue("@mod_method_id", modMethodId.ToString());
-        cmd.Parameters.AddWithValue("@body", body);
+        ");
+        cmd.Parameters["@mod_method_id"].Value = modMethodId.ToString();
+        cmd.Parameters["@body"].Value = body;
         cmd.ExecuteNonQuery();
     }
     
     public void InsertHarmonyPatch(long modMethodId, string targetType, string targetMethod,
                                    string patchType, string? filePath, int? lineNumber)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
-            INSERT INTO harmony_patches (mod_method_id, mod_name, target_type, target_method, patch_type, 
+        var cmd = GetCommand(@"
+            INSERT INTO harmony_patches (mod_id, mod_method_id, mod_name, target_type, target_method, patch_type, 
                                         file_path, line_number)
-            VALUES (@mod_method_id, '', @target_type, @target_method, @patch_type, @file_path, @line_number)
-        ";
+            SELECT mt.mod_id, @mod_method_id, COALESCE(m.name, ''), @target_type, @target_method, @patch_type,
+                   @file_path, @line_number
+            FROM (SELECT 1)
+            LEFT JOIN mod_methods mm ON mm.id = @mod_method_id
+            LEFT JOIN mod_types mt ON mt.id = mm.mod_type_id
+            LEFT JOIN mods m ON m.id = mt.mod_id
+        ");
         
-        cmd.Parameters.AddWithValue("@mod_method_id", modMethodId);
-        cmd.Parameters.AddWithValue("@target_type", targetType);
-        cmd.Parameters.AddWithValue("@target_method", targetMethod);
-        cmd.Parameters.AddWithValue("@patch_type", patchType);
-        cmd.Parameters.AddWithValue("@file_path", filePath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
+        cmd.Parameters["@mod_method_id"].Value = modMethodId;
+        cmd.Parameters["@target_type"].Value = targetType;
+        cmd.Parameters["@target_method"].Value = targetMethod;
+        cmd.Parameters["@patch_type"].Value = patchType;
+        cmd.Parameters["@file_path"].Value = filePath ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
         cmd.ExecuteNonQuery();
     }
     
     public void InsertXmlChange(long modId, string xmlFile, string xpath, string operation,
                                 string? propertyName, string? oldValue, string? newValue)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO xml_changes (mod_id, mod_name, file_name, xpath, operation, value)
-            VALUES (@mod_id, '', @file_name, @xpath, @operation, @value)
-        ";
+            VALUES (@mod_id, COALESCE((SELECT name FROM mods WHERE id = @mod_id), ''),
+                    @file_name, @xpath, @operation, @value)
+        ");
         
-        cmd.Parameters.AddWithValue("@mod_id", modId);
-        cmd.Parameters.AddWithValue("@file_name", xmlFile);
-        cmd.Parameters.AddWithValue("@xpath", xpath);
-        cmd.Parameters.AddWithValue("@operation", operation);
-        cmd.Parameters.AddWithValue("@value", newValue ?? (object)DBNull.Value);
+        cmd.Parameters["@mod_id"].Value = modId;
+        cmd.Parameters["@file_name"].Value = xmlFile;
+        cmd.Parameters["@xpath"].Value = xpath;
+        cmd.Parameters["@operation"].Value = operation;
+        cmd.Parameters["@value"].Value = newValue ?? (object)DBNull.Value;
         cmd.ExecuteNonQuery();
     }
     
@@ -412,18 +444,17 @@ public class SqliteWriter : IDisposable
     public void InsertEventDeclaration(string owningType, string eventName, string? delegateType,
                                         bool isPublic, string? filePath, int? lineNumber)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT OR IGNORE INTO event_declarations (owning_type, event_name, delegate_type, is_public, file_path, line_number)
             VALUES (@owning_type, @event_name, @delegate_type, @is_public, @file_path, @line_number)
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@owning_type", owningType);
-        cmd.Parameters.AddWithValue("@event_name", eventName);
-        cmd.Parameters.AddWithValue("@delegate_type", delegateType ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@is_public", isPublic ? 1 : 0);
-        cmd.Parameters.AddWithValue("@file_path", filePath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
+        cmd.Parameters["@owning_type"].Value = owningType;
+        cmd.Parameters["@event_name"].Value = eventName;
+        cmd.Parameters["@delegate_type"].Value = delegateType ?? (object)DBNull.Value;
+        cmd.Parameters["@is_public"].Value = isPublic ? 1 : 0;
+        cmd.Parameters["@file_path"].Value = filePath ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
         cmd.ExecuteNonQuery();
     }
     
@@ -431,24 +462,23 @@ public class SqliteWriter : IDisposable
                                          string handlerMethod, string? handlerType, string subscriptionType,
                                          bool isMod, long? modId, string? filePath, int? lineNumber)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO event_subscriptions (subscriber_type, event_owner_type, event_name, handler_method, 
                                              handler_type, subscription_type, is_mod, mod_id, file_path, line_number)
             VALUES (@subscriber_type, @event_owner_type, @event_name, @handler_method, 
                     @handler_type, @subscription_type, @is_mod, @mod_id, @file_path, @line_number)
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@subscriber_type", subscriberType);
-        cmd.Parameters.AddWithValue("@event_owner_type", eventOwnerType);
-        cmd.Parameters.AddWithValue("@event_name", eventName);
-        cmd.Parameters.AddWithValue("@handler_method", handlerMethod);
-        cmd.Parameters.AddWithValue("@handler_type", handlerType ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@subscription_type", subscriptionType);
-        cmd.Parameters.AddWithValue("@is_mod", isMod ? 1 : 0);
-        cmd.Parameters.AddWithValue("@mod_id", modId ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@file_path", filePath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
+        cmd.Parameters["@subscriber_type"].Value = subscriberType;
+        cmd.Parameters["@event_owner_type"].Value = eventOwnerType;
+        cmd.Parameters["@event_name"].Value = eventName;
+        cmd.Parameters["@handler_method"].Value = handlerMethod;
+        cmd.Parameters["@handler_type"].Value = handlerType ?? (object)DBNull.Value;
+        cmd.Parameters["@subscription_type"].Value = subscriptionType;
+        cmd.Parameters["@is_mod"].Value = isMod ? 1 : 0;
+        cmd.Parameters["@mod_id"].Value = modId ?? (object)DBNull.Value;
+        cmd.Parameters["@file_path"].Value = filePath ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
         cmd.ExecuteNonQuery();
     }
     
@@ -456,23 +486,22 @@ public class SqliteWriter : IDisposable
                                  string fireMethod, bool isConditional, bool isMod, long? modId,
                                  string? filePath, int? lineNumber)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO event_fires (firing_type, event_owner_type, event_name, fire_method, 
                                      is_conditional, is_mod, mod_id, file_path, line_number)
             VALUES (@firing_type, @event_owner_type, @event_name, @fire_method, 
                     @is_conditional, @is_mod, @mod_id, @file_path, @line_number)
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@firing_type", firingType);
-        cmd.Parameters.AddWithValue("@event_owner_type", eventOwnerType);
-        cmd.Parameters.AddWithValue("@event_name", eventName);
-        cmd.Parameters.AddWithValue("@fire_method", fireMethod);
-        cmd.Parameters.AddWithValue("@is_conditional", isConditional ? 1 : 0);
-        cmd.Parameters.AddWithValue("@is_mod", isMod ? 1 : 0);
-        cmd.Parameters.AddWithValue("@mod_id", modId ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@file_path", filePath ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@line_number", lineNumber ?? (object)DBNull.Value);
+        cmd.Parameters["@firing_type"].Value = firingType;
+        cmd.Parameters["@event_owner_type"].Value = eventOwnerType;
+        cmd.Parameters["@event_name"].Value = eventName;
+        cmd.Parameters["@fire_method"].Value = fireMethod;
+        cmd.Parameters["@is_conditional"].Value = isConditional ? 1 : 0;
+        cmd.Parameters["@is_mod"].Value = isMod ? 1 : 0;
+        cmd.Parameters["@mod_id"].Value = modId ?? (object)DBNull.Value;
+        cmd.Parameters["@file_path"].Value = filePath ?? (object)DBNull.Value;
+        cmd.Parameters["@line_number"].Value = lineNumber ?? (object)DBNull.Value;
         cmd.ExecuteNonQuery();
     }
     
@@ -480,22 +509,21 @@ public class SqliteWriter : IDisposable
                                       string? triggerEvent, string outcomeDesc, long? outcomeMethodId,
                                       string flowJson, string? modsInvolved)
     {
-        using var cmd = _connection.CreateCommand();
-        cmd.CommandText = @"
+        var cmd = GetCommand(@"
             INSERT INTO behavioral_flows (trigger_description, trigger_type, trigger_method_id, trigger_event,
                                           outcome_description, outcome_method_id, flow_json, mods_involved)
             VALUES (@trigger_desc, @trigger_type, @trigger_method_id, @trigger_event,
                     @outcome_desc, @outcome_method_id, @flow_json, @mods_involved)
-        ";
+        ");
         
-        cmd.Parameters.AddWithValue("@trigger_desc", triggerDesc);
-        cmd.Parameters.AddWithValue("@trigger_type", triggerType ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@trigger_method_id", triggerMethodId ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@trigger_event", triggerEvent ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@outcome_desc", outcomeDesc);
-        cmd.Parameters.AddWithValue("@outcome_method_id", outcomeMethodId ?? (object)DBNull.Value);
-        cmd.Parameters.AddWithValue("@flow_json", flowJson);
-        cmd.Parameters.AddWithValue("@mods_involved", modsInvolved ?? (object)DBNull.Value);
+        cmd.Parameters["@trigger_desc"].Value = triggerDesc;
+        cmd.Parameters["@trigger_type"].Value = triggerType ?? (object)DBNull.Value;
+        cmd.Parameters["@trigger_method_id"].Value = triggerMethodId ?? (object)DBNull.Value;
+        cmd.Parameters["@trigger_event"].Value = triggerEvent ?? (object)DBNull.Value;
+        cmd.Parameters["@outcome_desc"].Value = outcomeDesc;
+        cmd.Parameters["@outcome_method_id"].Value = outcomeMethodId ?? (object)DBNull.Value;
+        cmd.Parameters["@flow_json"].Value = flowJson;
+        cmd.Parameters["@mods_involved"].Value = modsInvolved ?? (object)DBNull.Value;
         cmd.ExecuteNonQuery();
     }
     
@@ -507,7 +535,12 @@ public class SqliteWriter : IDisposable
     {
         if (!_disposed)
         {
+            foreach (var cmd in _commands.Values)
+                cmd.Dispose();
+            _commands.Clear();
             _connection.Close();
+            // Drop the pooled handle too, so the file is really closed when the writer is done
+            SqliteConnection.ClearPool(_connection);
             _connection.Dispose();
             _disposed = true;
         }
@@ -0,0 +1,332 @@
+using System.Runtime.InteropServices;
+using Microsoft.Data.Sqlite;
+
+/// <summary>
+/// In-memory view of the internal call graph (the calls table) for path queries.
+/// Edges are read in a single pass, method ids are compacted to dense vertex
+/// indices, and adjacency is stored CSR-style (offsets + targets) in flat int arrays.
+/// </summary>
+class CallGraph
+{
+    private readonly long[] _vertexToId;              // vertex index -> method id, sorted ascending
+    private readonly int[] _offsets;                  // out-edges of v: _targets[_offsets[v].._offsets[v+1]]
+    private readonly int[] _targets;
+
+    public int VertexCount => _vertexToId.Length;
+    public int EdgeCount => _targets.Length;
+
+    private CallGraph(long[] vertexToId, int[] offsets, int[] targets)
+    {
+        _vertexToId = vertexToId;
+        _offsets = offsets;
+        _targets = targets;
+    }
+
+    /// <summary>
+    /// Load all distinct caller -> callee edges from the database.
+    /// </summary>
+    public static CallGraph Load(SqliteConnection conn)
+    {
+        // Single read, no up-front COUNT(*): that would be a second full scan and could
+        // disagree with the edge query if rows are committed in between
+        var callers = new List<long>();
+        var callees = new List<long>();
+        using (var cmd = conn.CreateCommand())
+        {
+            // Ordered by caller so the CSR layout falls out of the read order
+            // (served straight from idx_calls_caller_callee)
+            cmd.CommandText = @"
+                SELECT DISTINCT caller_id, callee_id
+                FROM calls
+                ORDER BY caller_id, callee_id";
+            using var reader = cmd.ExecuteReader();
+            while (reader.Read())
+            {
+                callers.Add(reader.GetInt64(0));
+                callees.Add(reader.GetInt64(1));
+            }
+        }
+        var edgeCount = callers.Count;
+
+        // Dense vertex ids: sorted, de-duplicated method ids
+        var ids = new long[edgeCount * 2];
+        callers.CopyTo(ids, 0);
+        callees.CopyTo(ids, edgeCount);
+        Array.Sort(ids);
+        var n = 0;
+        for (int i = 0; i < ids.Length; i++)
+        {
+            if (n == 0 || ids[i] != ids[n - 1])
+                ids[n++] = ids[i];
+        }
+        Array.Resize(ref ids, n);
+
+        // CSR: edges are already grouped by caller, so targets keep read order
+        // and offsets are just per-caller counts turned into a prefix sum
+        var offsets = new int[n + 1];
+        var targets = new int[edgeCount];
+        for (int e = 0; e < edgeCount; e++)
+        {
+            offsets[Array.BinarySearch(ids, callers[e]) + 1]++;
+            targets[e] = Array.BinarySearch(ids, callees[e]);
+        }
+        for (int v = 0; v < n; v++)
+            offsets[v + 1] += offsets[v];
+
+        return new CallGraph(ids, offsets, targets);
+    }
+
+    // ========================================================================
+    // Sidecar cache - <db>.graph.bin holds the CSR arrays so repeated queries
+    // against an unchanged database skip re-reading the calls table.
+    // ========================================================================
+
+    private const int CacheMagic = 0x32524743;   // "CGR2"
+
+    /// <summary>
+    /// Load the graph from the sidecar cache next to the database when it was
+    /// built from the same database file (size and write time); otherwise load
+    /// from the calls table and refresh the cache. Cache I/O is best effort.
+    /// </summary>
+    public static CallGraph LoadCached(SqliteConnection conn)
+    {
+        var dbPath = conn.DataSource;
+        if (string.IsNullOrEmpty(dbPath) || !File.Exists(dbPath))
+            return Load(conn);
+
+        // Committed-but-uncheckpointed WAL frames change the data without touching
+        // the main file, so the file stamp cannot vouch for it: skip the cache
+        if (GetDatabaseStamp(dbPath) is not { } stamp)
+            return Load(conn);
+
+        var cachePath = dbPath + ".graph.bin";
+
+        try
+        {
+            if (File.Exists(cachePath) && TryReadCache(cachePath, stamp) is { } cached)
+                return cached;
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException or EndOfStreamException)
+        {
+            // Unreadable cache - rebuild below
+        }
+
+        var graph = Load(conn);
+        try
+        {
+            graph.WriteCache(cachePath, stamp);
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            // Read-only location - still usable, just not cached
+        }
+        return graph;
+    }
+
+    /// <summary>
+    /// Identity of the database contents: length and write time of the main file,
+    /// or null when the WAL holds frames. The WAL's own write time is not usable -
+    /// opening a WAL database recreates an empty -wal file on every run - but an
+    /// empty (or missing) WAL means everything is in the main file.
+    /// </summary>
+    private static (long Length, long WriteTicks)? GetDatabaseStamp(string dbPath)
+    {
+        var wal = new FileInfo(dbPath + "-wal");
+        if (wal.Exists && wal.Length > 0)
+            return null;
+
+        var db = new FileInfo(dbPath);
+        return (db.Length, db.LastWriteTimeUtc.Ticks);
+    }
+
+    private static CallGraph? TryReadCache(string cachePath, (long Length, long WriteTicks) stamp)
+    {
+        using var stream = new FileStream(cachePath, FileMode.Open, FileAccess.Read, FileShare.Read, 1 << 16);
+        using var reader = new BinaryReader(stream);
+
+        if (reader.ReadInt32() != CacheMagic ||
+            reader.ReadInt64() != stamp.Length ||
+            reader.ReadInt64() != stamp.WriteTicks)
+            return null;
+
+        var vertexCount = reader.ReadInt32();
+        var edgeCount = reader.ReadInt32();
+
+        // The counts must describe exactly the bytes that follow; this also rejects
+        // corrupt counts before they turn into overflowing or huge allocations
+        var bodyLength = vertexCount * 8L + (vertexCount + 1L) * 4 + edgeCount * 4L;
+        if (vertexCount < 0 || edgeCount < 0 || bodyLength != stream.Length - stream.Position)
+            return null;
+
+        var ids = new long[vertexCount];
+        var offsets = new int[vertexCount + 1];
+        var targets = new int[edgeCount];
+        stream.ReadExactly(MemoryMarshal.AsBytes(ids.AsSpan()));
+        stream.ReadExactly(MemoryMarshal.AsBytes(offsets.AsSpan()));
+        stream.ReadExactly(MemoryMarshal.AsBytes(targets.AsSpan()));
+
+        // Traversal indexes straight into these arrays, so check the CSR shape here
+        if (offsets[0] != 0 || offsets[vertexCount] != edgeCount)
+            return null;
+        for (int v = 0; v < vertexCount; v++)
+        {
+            if (offsets[v + 1] < offsets[v])
+                return null;
+        }
+        foreach (var target in targets)
+        {
+            if ((uint)target >= (uint)vertexCount)
+                return null;
+        }
+
+        return new CallGraph(ids, offsets, targets);
+    }
+
+    private void WriteCache(string cachePath, (long Length, long WriteTicks) stamp)
+    {
+        // Write to a temp file and swap in, so a concurrent reader never sees half a cache
+        var tempPath = cachePath + ".tmp";
+        using (var stream = new FileStream(tempPath, FileMode.Create, FileAccess.Write, FileShare.None, 1 << 16))
+        using (var writer = new BinaryWriter(stream))
+        {
+            writer.Write(CacheMagic);
+            writer.Write(stamp.Length);
+            writer.Write(stamp.WriteTicks);
+            writer.Write(VertexCount);
+            writer.Write(EdgeCount);
+            writer.Flush();
+            stream.Write(MemoryMarshal.AsBytes(_vertexToId.AsSpan()));
+            stream.Write(MemoryMarshal.AsBytes(_offsets.AsSpan()));
+            stream.Write(MemoryMarshal.AsBytes(_targets.AsSpan()));
+        }
+        File.Move(tempPath, cachePath, overwrite: true);
+    }
+
+    /// <summary>
+    /// Map a method id to its vertex index. Vertex ids are positions in the sorted
+    /// id array, so this is a binary search rather than a hash lookup.
+    /// </summary>
+    public bool TryGetVertex(long methodId, out int vertex)
+    {
+        vertex = Array.BinarySearch(_vertexToId, methodId);
+        return vertex >= 0;
+    }
+
+    /// <summary>
+    /// Map vertex indices back to method ids.
+    /// </summary>
+    public long[] ToMethodIds(ReadOnlySpan<int> vertices)
+    {
+        var ids = new long[vertices.Length];
+        for (int i = 0; i < vertices.Length; i++)
+            ids[i] = _vertexToId[vertices[i]];
+        return ids;
+    }
+
+    /// <summary>
+    /// Find up to <paramref name="maxPaths"/> simple paths (no repeated method) from
+    /// one method to another using at most <paramref name="maxDepth"/> calls.
+    /// Paths are returned as method ids, shortest first.
+    /// </summary>
+    public List<long[]> FindPaths(long fromId, long toId, int maxDepth, int maxPaths)
+    {
+        var results = new List<long[]>();
+        if (!TryGetVertex(fromId, out var from) || !TryGetVertex(toId, out var to))
+            return results;
+        if (from == to)
+        {
+            results.Add(new[] { fromId });
+            return results;
+        }
+
+        // Calls needed to reach the target from each vertex; lets the search skip
+        // any branch that cannot arrive within the remaining depth.
+        var dist = DistancesTo(to, maxDepth);
+        if (dist[from] > maxDepth)
+            return results;
+
+        // Explicit-stack DFS: path[d] is the vertex at depth d and cursor[d] the next
+        // out-edge to try from it. Each pass enumerates paths of exactly `length`
+        // calls, so results come out shortest first and stop once maxPaths is hit.
+        var path = new int[maxDepth + 1];
+        var cursor = new int[maxDepth + 1];
+        var onPath = new bool[VertexCount];
+
+        for (int length = dist[from]; length <= maxDepth && results.Count < maxPaths; length++)
+        {
+            var depth = 0;
+            path[0] = from;
+            cursor[0] = _offsets[from];
+            onPath[from] = true;
+
+            while (depth >= 0 && results.Count < maxPaths)
+            {
+                var v = path[depth];
+                if (cursor[depth] == _offsets[v + 1])
+                {
+                    onPath[v] = false;
+                    depth--;
+                    continue;
+                }
+
+                var next = _targets[cursor[depth]++];
+                if (onPath[next] || dist[next] > length - depth - 1)
+                    continue;
+
+                if (next == to)
+                {
+                    if (depth + 1 == length)
+                    {
+                        path[length] = to;
+                        results.Add(ToMethodIds(path.AsSpan(0, length + 1)));
+                    }
+                    continue;
+                }
+
+                depth++;
+                path[depth] = next;
+                cursor[depth] = _offsets[next];
+                onPath[next] = true;
+            }
+
+            for (int d = 0; d <= depth; d++)
+                onPath[path[d]] = false;
+        }
+
+        return results;
+    }
+
+    /// <summary>
+    /// Number of calls needed to reach <paramref name="target"/> from every vertex,
+    /// or int.MaxValue when it is further than <paramref name="maxDepth"/>.
+    /// </summary>
+    private int[] DistancesTo(int target, int maxDepth)
+    {
+        var dist = new int[VertexCount];
+        Array.Fill(dist, int.MaxValue);
+        dist[target] = 0;
+
+        for (int round = 1; round <= maxDepth; round++)
+        {
+            var changed = false;
+            for (int v = 0; v < VertexCount; v++)
+            {
+                if (dist[v] <= round)
+                    continue;
+                for (int i = _offsets[v]; i < _offsets[v + 1]; i++)
+                {
+                    if (dist[_targets[i]] == round - 1)
+                    {
+                        dist[v] = round;
+                        changed = true;
+                        break;
+                    }
+                }
+            }
+            if (!changed)
+                break;
+        }
+
+        return dist;
+    }
+}
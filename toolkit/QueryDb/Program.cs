@@ -7,9 +7,10 @@
 //   dotnet run -- <database.db> search <keyword>       Full-text search in method bodies
 //   dotnet run -- <database.db> chain <from> <to>      Find call path between methods
 //   dotnet run -- <database.db> implementations <method>  Find all implementations/overrides
-//   dotnet run -- <database.db> compat                 Check mod compatibility
+//   dotnet run -- <database.db> compat [mod...]        Check mod compatibility
 //   dotnet run -- <database.db> perf                   Performance analysis of game code
 
+using System.Runtime.CompilerServices;
 using System.Text.Json;
 using Microsoft.Data.Sqlite;
 
@@ -17,60 +18,104 @@ class Program
 {
     static SqliteConnection? _conn;
     static bool _jsonOutput = false;
-    
+
+    // Shared so --json output doesn't construct writer options per query
+    static readonly JsonWriterOptions IndentedJson = new() { Indented = true };
+
+    // Command table. Dispatch is resolved before the database is opened so that
+    // usage/help and mistyped commands never pay for opening the SQLite file.
+    static readonly Dictionary<string, Func<string[], int>> Commands = new()
+    {
+        ["sql"] = RunCustomSql,
+        ["callers"] = FindCallers,
+        ["callees"] = FindCallees,
+        ["search"] = SearchBodies,
+        ["chain"] = FindChain,
+        ["implementations"] = FindImplementations,
+        ["impl"] = FindImplementations,
+        ["compat"] = CheckCompatibility,
+        ["perf"] = PerformanceAnalysis,
+        ["performance"] = PerformanceAnalysis,
+        ["xml"] = XmlQuery,
+        ["flow"] = TraceFlow,
+        ["events"] = ShowEvents,
+        ["effective"] = ShowEffectiveBehavior,
+    };
+
     static int Main(string[] args)
     {
+        // Check for --json flag
+        var argList = args.ToList();
+        if (argList.Contains("--json"))
+        {
+            _jsonOutput = true;
+            argList.Remove("--json");
+            args = argList.ToArray();
+        }
+
         if (args.Length == 0)
         {
             PrintUsage();
             return 1;
         }
 
-        var dbPath = args[0];
-        if (!File.Exists(dbPath))
+        if (args[0] is "help" or "--help" or "-h")
         {
-            Console.WriteLine($"Database not found: {dbPath}");
-            return 1;
+            PrintUsage();
+            return 0;
         }
 
-        _conn = new SqliteConnection($"Data Source={dbPath}");
-        _conn.Open();
+        var dbPath = args[0];
+        var command = args.Length > 1 ? args[1].ToLower() : null;
+        var cmdArgs = args.Skip(2).ToArray();
 
-        // Check for --json flag
-        var argList = args.ToList();
-        if (argList.Contains("--json"))
+        // `QueryDb <db> --exact` is the summary with true COUNT(*) row counts
+        var exactCounts = command == "--exact";
+        if (exactCounts)
+            command = null;
+
+        if (command is "help" or "--help" or "-h")
         {
-            _jsonOutput = true;
-            argList.Remove("--json");
-            args = argList.ToArray();
+            PrintUsage();
+            return 0;
         }
 
-        if (args.Length == 1)
+        var isQa = command is "qa" or "analyze";
+        if (command != null && !isQa && !Commands.ContainsKey(command))
+            return UnknownCommand(command);
+
+        if (!File.Exists(dbPath))
         {
-            ShowSummary();
-            return 0;
+            Console.WriteLine($"Database not found: {dbPath}");
+            return 1;
         }
 
-        var command = args[1].ToLower();
-        var cmdArgs = args.Skip(2).ToArray();
+        // QA analysis opens the database through CallGraphExtractor.ModAnalyzer
+        if (isQa)
+            return RunModQa(cmdArgs, dbPath);
 
-        return command switch
+        // One connection serves the whole command (graph load, label lookups,
+        // follow-up queries); closed on the way out so WAL is checkpointed.
+        _conn = new SqliteConnection($"Data Source={dbPath}");
+        try
         {
-            "sql" => RunCustomSql(cmdArgs),
-            "callers" => FindCallers(cmdArgs),
-            "callees" => FindCallees(cmdArgs),
-            "search" => SearchBodies(cmdArgs),
-            "chain" => FindChain(cmdArgs),
-            "implementations" or "impl" => FindImplementations(cmdArgs),
-            "compat" => CheckCompatibility(cmdArgs),
-            "perf" or "performance" => PerformanceAnalysis(cmdArgs),
-            "xml" => XmlQuery(cmdArgs),
-            "flow" => TraceFlow(cmdArgs),
-            "events" => ShowEvents(cmdArgs),
-            "effective" => ShowEffectiveBehavior(cmdArgs),
-            "qa" or "analyze" => RunModQa(cmdArgs, dbPath),
-            _ => UnknownCommand(command)
-        };
+            _conn.Open();
+            ConfigureConnection();
+
+            if (command == null)
+            {
+                ShowSummary(exactCounts);
+                return 0;
+            }
+
+            return Commands[command](cmdArgs);
+        }
+        finally
+        {
+            _conn.Dispose();
+            _conn = null;
+            SqliteConnection.ClearAllPools();
+        }
     }
 
     static void PrintUsage()
@@ -79,19 +124,21 @@ class Program
 
 Usage:
   QueryDb <database.db>                           Show summary statistics
+  QueryDb <database.db> --exact                   Summary with exact (COUNT(*)) row counts
   QueryDb <database.db> sql ""SELECT ...""          Run custom SQL query
   QueryDb <database.db> callers <method>          Find all callers of a method
   QueryDb <database.db> callees <method>          Find all methods called by a method  
   QueryDb <database.db> search <keyword>          Full-text search in method bodies
   QueryDb <database.db> chain <from> <to>         Find call path between methods
   QueryDb <database.db> impl <method>             Find all implementations/overrides
-  QueryDb <database.db> compat                    Check mod compatibility (conflicts)
+  QueryDb <database.db> compat [mod...]           Check mod compatibility (conflicts)
   QueryDb <database.db> perf [category]           Performance analysis of game code
   QueryDb <database.db> xml <item-or-property>    Query XML definitions
   QueryDb <database.db> flow <event-or-method>    Trace behavioral flow (events + patches)
   QueryDb <database.db> events <event-name>       Show event subscriptions and fires
   QueryDb <database.db> effective <method>        Show effective behavior with patches
   QueryDb <database.db> qa <mod-path>             Run automated QA analysis on a mod
+  QueryDb help                                    Show this help (no database needed)
 
 Options:
   --json                                          Output results as JSON
@@ -120,27 +167,34 @@ Examples:
     // ========================================================================
     // SUMMARY - Default view showing database statistics
     // ========================================================================
-    static void ShowSummary()
+    static readonly (string Label, string Table)[] SummaryTables =
+    {
+        ("Types", "types"),
+        ("Methods", "methods"),
+        ("Internal Calls", "calls"),
+        ("External Calls", "external_calls"),
+        ("Method Bodies (FTS)", "method_bodies"),
+        ("XML Definitions", "xml_definitions"),
+        ("XML Property Access", "xml_property_access"),
+        ("Event Declarations", "event_declarations"),
+        ("Event Subscriptions", "event_subscriptions"),
+        ("Event Fires", "event_fires"),
+        ("Mods", "mods"),
+        ("Harmony Patches", "harmony_patches"),
+    };
+
+    static void ShowSummary(bool exactCounts)
     {
         Console.WriteLine($"Database: {_conn!.DataSource}");
         Console.WriteLine("═══════════════════════════════════════════════════════════════════");
         Console.WriteLine();
 
-        Console.WriteLine("Table Counts:");
-        RunQuery(@"
-            SELECT 'Types' as tbl, COUNT(*) as cnt FROM types 
-            UNION ALL SELECT 'Methods', COUNT(*) FROM methods 
-            UNION ALL SELECT 'Internal Calls', COUNT(*) FROM calls 
-            UNION ALL SELECT 'External Calls', COUNT(*) FROM external_calls 
-            UNION ALL SELECT 'Method Bodies (FTS)', COUNT(*) FROM method_bodies
-            UNION ALL SELECT 'XML Definitions', COUNT(*) FROM xml_definitions
-            UNION ALL SELECT 'XML Property Access', COUNT(*) FROM xml_property_access
-            UNION ALL SELECT 'Event Declarations', COUNT(*) FROM event_declarations
-            UNION ALL SELECT 'Event Subscriptions', COUNT(*) FROM event_subscriptions
-            UNION ALL SELECT 'Event Fires', COUNT(*) FROM event_fires
-            UNION ALL SELECT 'Mods', COUNT(*) FROM mods
-            UNION ALL SELECT 'Harmony Patches', COUNT(*) FROM harmony_patches
-        ");
+        // The extractor builds a fresh, insert-only database, so MAX(rowid) equals
+        // the row count and is a single b-tree seek; COUNT(*) scans every table.
+        var countExpr = exactCounts ? "COUNT(*)" : "COALESCE(MAX(rowid), 0)";
+        Console.WriteLine(exactCounts ? "Table Counts:" : "Table Counts (from max rowid; --exact to count rows):");
+        RunQuery(string.Join("\n            UNION ALL ",
+            SummaryTables.Select(t => $"SELECT '{t.Label}' as tbl, {countExpr} as cnt FROM {t.Table}")));
 
         Console.WriteLine("\nTypes by Assembly:");
         RunQuery("SELECT assembly, COUNT(*) as count FROM types GROUP BY assembly ORDER BY count DESC");
@@ -315,22 +369,32 @@ Examples:
         var searchTerm = string.Join(" ", args);
         Console.WriteLine($"Searching for: {searchTerm}\n");
 
-        RunQuery($@"
+        // Rank and LIMIT inside the FTS query first, then join only the surviving
+        // hits to methods/types. MATERIALIZED keeps the planner from flattening the
+        // CTE and driving the join from the methods side.
+        RunQuery(@"
+            WITH hits AS MATERIALIZED (
+                SELECT method_id,
+                       rank as score,
+                       snippet(method_bodies, 1, '>>>', '<<<', '...', 20) as context
+                FROM method_bodies
+                WHERE method_bodies MATCH @query
+                ORDER BY rank
+                LIMIT 30
+            )
             SELECT t.name || '.' || m.name as method,
                    m.file_path, m.line_number,
-                   snippet(method_bodies, 1, '>>>', '<<<', '...', 20) as context
-            FROM method_bodies mb
-            JOIN methods m ON mb.method_id = m.id
+                   h.context
+            FROM hits h
+            JOIN methods m ON h.method_id = m.id
             JOIN types t ON m.type_id = t.id
-            WHERE method_bodies MATCH '{searchTerm.Replace("'", "''")}'
-            ORDER BY rank
-            LIMIT 30
-        ");
+            ORDER BY h.score
+        ", ("@query", searchTerm));
         return 0;
     }
 
     // ========================================================================
-    // CHAIN - Find call path between two methods using recursive CTE
+    // CHAIN - Find call path between two methods using the in-memory call graph
     // ========================================================================
     static int FindChain(string[] args)
     {
@@ -364,48 +428,23 @@ Examples:
 
         Console.WriteLine($"Finding path from {fromMethod.FullName} to {toMethod.FullName}...\n");
 
-        // Use recursive CTE for BFS path finding
-        // Limited to depth 10 to prevent runaway queries
-        var sql = $@"
-            WITH RECURSIVE call_path(method_id, path, depth) AS (
-                -- Start from the source method
-                SELECT {fromMethod.Id}, '{fromMethod.FullName}', 0
-                
-                UNION ALL
-                
-                -- Recursively find callees
-                SELECT c.callee_id,
-                       cp.path || ' -> ' || t.name || '.' || m.name,
-                       cp.depth + 1
-                FROM call_path cp
-                JOIN calls c ON c.caller_id = cp.method_id
-                JOIN methods m ON c.callee_id = m.id
-                JOIN types t ON m.type_id = t.id
-                WHERE cp.depth < 10
-                  AND cp.path NOT LIKE '%' || t.name || '.' || m.name || '%'  -- Prevent cycles
-            )
-            SELECT path, depth
-            FROM call_path
-            WHERE method_id = {toMethod.Id}
-            ORDER BY depth
-            LIMIT 5
-        ";
+        // Walk the call graph in memory; depth limited to 10 to bound the search
+        var graph = CallGraph.LoadCached(_conn!);
+        var paths = graph.FindPaths(fromMethod.Id, toMethod.Id, maxDepth: 10, maxPaths: 5);
 
-        using var cmd = _conn!.CreateCommand();
-        cmd.CommandText = sql;
-        using var reader = cmd.ExecuteReader();
+        var labels = GetMethodLabels(paths.SelectMany(p => p.Skip(1)));
 
         var found = false;
-        while (reader.Read())
+        foreach (var path in paths)
         {
             found = true;
-            var path = reader.GetString(0);
-            var depth = reader.GetInt32(1);
+            var depth = path.Length - 1;
             Console.WriteLine($"Path (depth {depth}):");
-            var steps = path.Split(" -> ");
-            for (int i = 0; i < steps.Length; i++)
+            for (int i = 0; i < path.Length; i++)
             {
-                Console.WriteLine($"  {new string(' ', i * 2)}{(i > 0 ? "└─ " : "")}{steps[i]}");
+                var step = i == 0 ? fromMethod.FullName
+                    : labels.TryGetValue(path[i], out var label) ? label : $"<method {path[i]}>";
+                Console.WriteLine($"  {new string(' ', i * 2)}{(i > 0 ? "└─ " : "")}{step}");
             }
             Console.WriteLine();
         }
@@ -473,20 +512,46 @@ Examples:
         Console.WriteLine("                     MOD COMPATIBILITY CHECK                        ");
         Console.WriteLine("═══════════════════════════════════════════════════════════════════\n");
 
+        // Optional mod names restrict the check to conflicts among those mods. The names
+        // go into a temp table so SQLite filters through its mod_name indexes instead of
+        // aggregating every mod and discarding the rest afterwards.
+        var modFilter = "";
+        if (args.Length > 0)
+        {
+            using (var create = _conn!.CreateCommand())
+            {
+                create.CommandText = "CREATE TEMP TABLE IF NOT EXISTS tmp_mods (name TEXT PRIMARY KEY); DELETE FROM tmp_mods;";
+                create.ExecuteNonQuery();
+            }
+            using var insert = _conn!.CreateCommand();
+            insert.CommandText = "INSERT OR IGNORE INTO tmp_mods (name) VALUES (@name)";
+            var nameParam = insert.Parameters.Add("@name", SqliteType.Text);
+            foreach (var modName in args)
+            {
+                nameParam.Value = modName;
+                insert.ExecuteNonQuery();
+            }
+            modFilter = "mod_name IN (SELECT name FROM tmp_mods)";
+            Console.WriteLine($"Checking: {string.Join(", ", args)}\n");
+        }
+        var where = modFilter.Length > 0 ? $"WHERE {modFilter}" : "";
+        var and = modFilter.Length > 0 ? $"AND {modFilter}" : "";
+
         // List all mods
         Console.WriteLine("Mods in database:");
-        RunQuery("SELECT name, version, author FROM mods");
+        RunQuery($"SELECT name, version, author FROM mods {(modFilter.Length > 0 ? "WHERE name IN (SELECT name FROM tmp_mods)" : "")}");
 
         // Check for Harmony patch conflicts (same method patched by multiple mods)
         Console.WriteLine("\n═══ HARMONY PATCH CONFLICTS ═══");
         Console.WriteLine("Methods patched by multiple mods (potential conflicts):\n");
         
-        RunQuery(@"
+        RunQuery($@"
             SELECT target_type || '.' || target_method as target,
                    GROUP_CONCAT(DISTINCT mod_name) as mods,
                    GROUP_CONCAT(DISTINCT patch_type) as patch_types,
                    COUNT(DISTINCT mod_name) as mod_count
             FROM harmony_patches
+            {where}
             GROUP BY target_type, target_method
             HAVING COUNT(DISTINCT mod_name) > 1
             ORDER BY mod_count DESC
@@ -496,12 +561,13 @@ Examples:
         Console.WriteLine("\n═══ XML CONFLICTS ═══");
         Console.WriteLine("XML paths modified by multiple mods:\n");
         
-        RunQuery(@"
+        RunQuery($@"
             SELECT file_name || ':' || xpath as target,
                    GROUP_CONCAT(DISTINCT mod_name) as mods,
                    GROUP_CONCAT(DISTINCT operation) as operations,
                    COUNT(DISTINCT mod_name) as mod_count
             FROM xml_changes
+            {where}
             GROUP BY file_name, xpath
             HAVING COUNT(DISTINCT mod_name) > 1
             ORDER BY mod_count DESC
@@ -511,15 +577,16 @@ Examples:
         Console.WriteLine("\n═══ LOAD ORDER SUGGESTIONS ═══");
         Console.WriteLine("Transpilers should generally load before Prefix/Postfix on same method:\n");
         
-        RunQuery(@"
+        RunQuery($@"
             SELECT target_type || '.' || target_method as method,
                    GROUP_CONCAT(mod_name || ' [' || patch_type || ']', ', ') as patches
             FROM harmony_patches
             WHERE target_type || '.' || target_method IN (
                 SELECT target_type || '.' || target_method 
                 FROM harmony_patches 
-                WHERE patch_type = 'Transpiler'
+                WHERE patch_type = 'Transpiler' {and}
             )
+            {and}
             GROUP BY target_type, target_method
             HAVING COUNT(DISTINCT patch_type) > 1
             ORDER BY target_type, target_method
@@ -527,16 +594,16 @@ Examples:
 
         // Summary
         Console.WriteLine("\n═══ SUMMARY ═══");
-        RunQuery(@"
+        RunQuery($@"
             SELECT 
-                (SELECT COUNT(DISTINCT target_type || target_method) 
-                 FROM harmony_patches 
-                 GROUP BY target_type, target_method 
-                 HAVING COUNT(DISTINCT mod_name) > 1) as harmony_conflicts,
-                (SELECT COUNT(DISTINCT file_name || xpath) 
-                 FROM xml_changes 
-                 GROUP BY file_name, xpath 
-                 HAVING COUNT(DISTINCT mod_name) > 1) as xml_conflicts
+                (SELECT COUNT(*) FROM (
+                    SELECT 1 FROM harmony_patches {where}
+                    GROUP BY target_type, target_method 
+                    HAVING COUNT(DISTINCT mod_name) > 1)) as harmony_conflicts,
+                (SELECT COUNT(*) FROM (
+                    SELECT 1 FROM xml_changes {where}
+                    GROUP BY file_name, xpath 
+                    HAVING COUNT(DISTINCT mod_name) > 1)) as xml_conflicts
         ");
 
         return 0;
@@ -858,6 +925,30 @@ Examples:
             }
         }
 
+        // Patches on every matching handler, fetched in one pass rather than one
+        // query per subscriber while drawing the tree
+        var handlerPatches = new Dictionary<string, List<(string ModName, string PatchType)>>();
+        if (fires.Count > 0 && subscriptions.Count > 0)
+        {
+            using var cmd = _conn!.CreateCommand();
+            cmd.CommandText = @"
+                SELECT target_method, mod_name, patch_type
+                FROM harmony_patches
+                WHERE target_method IN (
+                    SELECT handler_method FROM event_subscriptions WHERE event_name LIKE @pattern)
+                ORDER BY id
+            ";
+            cmd.Parameters.AddWithValue("@pattern", $"%{query}%");
+            using var reader = cmd.ExecuteReader();
+            while (reader.Read())
+            {
+                var handler = reader.GetString(0);
+                if (!handlerPatches.TryGetValue(handler, out var patches))
+                    handlerPatches[handler] = patches = new List<(string, string)>();
+                patches.Add((reader.GetString(1), reader.GetString(2)));
+            }
+        }
+
         // Build visualization
         if (fires.Count > 0 || subscriptions.Count > 0)
         {
@@ -880,18 +971,11 @@ Examples:
                     Console.WriteLine($"{prefix} {sub.Subscriber}.{sub.Handler}");
                     
                     // Check if handler has patches
-                    using var cmd = _conn!.CreateCommand();
-                    cmd.CommandText = $@"
-                        SELECT mod_name, patch_type 
-                        FROM harmony_patches 
-                        WHERE target_method = '{sub.Handler}'
-                    ";
-                    using var reader = cmd.ExecuteReader();
-                    while (reader.Read())
-                    {
-                        var patchPrefix = i == matchingSubs.Count - 1 ? "          " : "      │   ";
-                        Console.WriteLine($"{patchPrefix}    └─► [{reader.GetString(1).ToUpper()}: {reader.GetString(0)}]");
-                    }
+                    if (!handlerPatches.TryGetValue(sub.Handler, out var patches))
+                        continue;
+                    var patchPrefix = i == matchingSubs.Count - 1 ? "          " : "      │   ";
+                    foreach (var (modName, patchType) in patches)
+                        Console.WriteLine($"{patchPrefix}    └─► [{patchType.ToUpper()}: {modName}]");
                 }
                 Console.WriteLine();
             }
@@ -1228,10 +1312,19 @@ Examples:
             return 1;
         }
 
+        return RunModQaAnalysis(dbPath, modPath, outputPath, verbose);
+    }
+
+    // Kept separate from RunModQa so the CallGraphExtractor assembly (and the Roslyn
+    // assemblies behind it) is only loaded by the JIT once an analysis actually runs,
+    // not when printing usage or rejecting a bad path.
+    [MethodImpl(MethodImplOptions.NoInlining)]
+    static int RunModQaAnalysis(string dbPath, string modPath, string? outputPath, bool verbose)
+    {
         try
         {
             // Run the analysis
-            var analyzer = new CallGraphExtractor.ModAnalyzer(dbPath, verbose);
+            using var analyzer = new CallGraphExtractor.ModAnalyzer(dbPath, verbose);
             var result = analyzer.Analyze(modPath);
             
             // Generate report
@@ -1264,6 +1357,21 @@ Examples:
         }
     }
 
+    /// <summary>
+    /// Read-heavy tuning for the query session. Connection-local only - the
+    /// database file itself is never modified (indexes live in schema.sql).
+    /// </summary>
+    static void ConfigureConnection()
+    {
+        using var pragma = _conn!.CreateCommand();
+        pragma.CommandText = @"
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            PRAGMA temp_store=MEMORY;
+        ";
+        pragma.ExecuteNonQuery();
+    }
+
     static bool TableExists(string tableName)
     {
         using var cmd = _conn!.CreateCommand();
@@ -1326,10 +1434,44 @@ Examples:
         return results;
     }
 
-    static void RunQuery(string sql)
+    // SQLite's default limit on bound parameters per statement
+    const int MaxSqlParameters = 999;
+
+    /// <summary>
+    /// Resolve "Type.Method" labels for a set of method ids with one IN query
+    /// per 999 ids instead of one query per id.
+    /// </summary>
+    static Dictionary<long, string> GetMethodLabels(IEnumerable<long> methodIds)
+    {
+        var labels = new Dictionary<long, string>();
+        foreach (var chunk in methodIds.Distinct().Chunk(MaxSqlParameters))
+        {
+            using var cmd = _conn!.CreateCommand();
+            var placeholders = new string[chunk.Length];
+            for (int i = 0; i < chunk.Length; i++)
+            {
+                placeholders[i] = $"@id{i}";
+                cmd.Parameters.AddWithValue(placeholders[i], chunk[i]);
+            }
+            cmd.CommandText = $@"
+                SELECT m.id, t.name || '.' || m.name
+                FROM methods m
+                JOIN types t ON m.type_id = t.id
+                WHERE m.id IN ({string.Join(",", placeholders)})
+            ";
+            using var reader = cmd.ExecuteReader();
+            while (reader.Read())
+                labels[reader.GetInt64(0)] = reader.GetString(1);
+        }
+        return labels;
+    }
+
+    static void RunQuery(string sql, params (string Name, object Value)[] parameters)
     {
         using var cmd = _conn!.CreateCommand();
         cmd.CommandText = sql;
+        foreach (var (name, value) in parameters)
+            cmd.Parameters.AddWithValue(name, value);
         
         try
         {
@@ -1337,19 +1479,40 @@ Examples:
             
             if (_jsonOutput)
             {
-                var results = new List<Dictionary<string, object?>>();
+                // Write each row as it is read instead of buffering the whole result set
                 var cols = Enumerable.Range(0, reader.FieldCount).Select(i => reader.GetName(i)).ToList();
-                
-                while (reader.Read())
+                var values = new object[cols.Count];
+                Console.Out.Flush();
+                using var stdout = Console.OpenStandardOutput();
+                using (var writer = new Utf8JsonWriter(stdout, IndentedJson))
                 {
-                    var row = new Dictionary<string, object?>();
-                    for (int i = 0; i < cols.Count; i++)
+                    writer.WriteStartArray();
+                    try
+                    {
+                        // A row is fully read before any of it is written, so a failure
+                        // part-way through the result never leaves half an object behind
+                        while (reader.Read())
+                        {
+                            reader.GetValues(values);
+                            writer.WriteStartObject();
+                            for (int i = 0; i < cols.Count; i++)
+                            {
+                                writer.WritePropertyName(cols[i]);
+                                if (values[i] is DBNull)
+                                    writer.WriteNullValue();
+                                else
+                                    JsonSerializer.Serialize(writer, values[i]);
+                            }
+                            writer.WriteEndObject();
+                        }
+                    }
+                    finally
                     {
-                        row[cols[i]] = reader.IsDBNull(i) ? null : reader.GetValue(i);
+                        // Close the array even on error so stdout stays valid JSON
+                        writer.WriteEndArray();
                     }
-                    results.Add(row);
                 }
-                Console.WriteLine(JsonSerializer.Serialize(results, new JsonSerializerOptions { WriteIndented = true }));
+                stdout.Write("\n"u8);
             }
             else
             {
@@ -1373,7 +1536,8 @@ Examples:
         }
         catch (SqliteException ex)
         {
-            Console.WriteLine($"SQL Error: {ex.Message}");
+            // In --json mode stdout carries only JSON; report the error on stderr
+            (_jsonOutput ? Console.Error : Console.Out).WriteLine($"SQL Error: {ex.Message}");
         }
     }
 }
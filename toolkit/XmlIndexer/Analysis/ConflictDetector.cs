@@ -50,25 +50,7 @@ public class ConflictDetector
         };
 
         // Calculate summary including new effect-level conflicts
-        report.Summary = new ConflictSummary
-        {
-            High = report.RealConflicts.Count(c => c.Severity == "HIGH") +
-                   report.DestructiveConflicts.Count +
-                   report.CSharpXmlConflicts.Count +
-                   report.EffectOperationConflicts.Count +
-                   report.SetOverridesAddConflicts.Count +
-                   report.TriggeredEffectConflicts.Count(c => c.Severity == "HIGH"),
-            Medium = report.RealConflicts.Count(c => c.Severity == "MEDIUM") +
-                     report.ContestedEntities.Count(e => e.RiskLevel == "MEDIUM") +
-                     report.SynergisticStackingWarnings.Count +
-                     report.MixedModifierInteractions.Count +
-                     report.PartialModifications.Count +
-                     report.TriggeredEffectConflicts.Count(c => c.Severity == "MEDIUM"),
-            Low = report.RealConflicts.Count(c => c.Severity == "LOW") +
-                  report.ContestedEntities.Count(e => e.RiskLevel == "LOW") +
-                  report.TriggeredEffectConflicts.Count(c => c.Severity == "LOW"),
-            TotalScore = CalculateTotalScore(report)
-        };
+        report.Summary = CalculateSummary(report);
 
         return report;
     }
@@ -78,16 +60,20 @@ public class ConflictDetector
     /// </summary>
     public void OutputJson(ConflictReport report)
     {
-        var options = new JsonSerializerOptions
-        {
-            WriteIndented = true,
-            PropertyNamingPolicy = JsonNamingPolicy.SnakeCaseLower,
-            DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull
-        };
-
-        Console.WriteLine(JsonSerializer.Serialize(report, options));
+        // Serialize straight into stdout rather than building the whole report as one string first
+        Console.Out.Flush();
+        using var stdout = Console.OpenStandardOutput();
+        JsonSerializer.Serialize(stdout, report, ReportJsonOptions);
+        stdout.Write("\n"u8);
     }
 
+    private static readonly JsonSerializerOptions ReportJsonOptions = new()
+    {
+        WriteIndented = true,
+        PropertyNamingPolicy = JsonNamingPolicy.SnakeCaseLower,
+        DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull
+    };
+
     private List<XPathConflict> GetRealConflicts(SqliteConnection db)
     {
         var conflicts = new List<XPathConflict>();
@@ -545,32 +531,47 @@ public class ConflictDetector
         return summaries;
     }
 
-    private int CalculateTotalScore(ConflictReport report)
+    /// <summary>
+    /// Severity totals across every conflict list, each list walked once.
+    /// Score weights: HIGH = 40, MEDIUM = 25, LOW = 10 points each.
+    /// </summary>
+    private static ConflictSummary CalculateSummary(ConflictReport report)
     {
-        int score = 0;
-
-        // HIGH severity = 40 points each
-        score += (report.RealConflicts.Count(c => c.Severity == "HIGH") +
-                  report.DestructiveConflicts.Count +
-                  report.CSharpXmlConflicts.Count +
-                  report.EffectOperationConflicts.Count +
-                  report.SetOverridesAddConflicts.Count +
-                  report.TriggeredEffectConflicts.Count(c => c.Severity == "HIGH")) * 40;
-
-        // MEDIUM severity = 25 points each
-        score += (report.RealConflicts.Count(c => c.Severity == "MEDIUM") +
-                  report.ContestedEntities.Count(e => e.RiskLevel == "MEDIUM") +
-                  report.SynergisticStackingWarnings.Count +
-                  report.MixedModifierInteractions.Count +
-                  report.PartialModifications.Count +
-                  report.TriggeredEffectConflicts.Count(c => c.Severity == "MEDIUM")) * 25;
-
-        // LOW severity = 10 points each
-        score += (report.RealConflicts.Count(c => c.Severity == "LOW") +
-                  report.ContestedEntities.Count(e => e.RiskLevel == "LOW") +
-                  report.TriggeredEffectConflicts.Count(c => c.Severity == "LOW")) * 10;
-
-        return score;
+        int high = report.DestructiveConflicts.Count +
+                   report.CSharpXmlConflicts.Count +
+                   report.EffectOperationConflicts.Count +
+                   report.SetOverridesAddConflicts.Count;
+        int medium = report.SynergisticStackingWarnings.Count +
+                     report.MixedModifierInteractions.Count +
+                     report.PartialModifications.Count;
+        int low = 0;
+
+        void Tally(string? severity)
+        {
+            switch (severity)
+            {
+                case "HIGH": high++; break;
+                case "MEDIUM": medium++; break;
+                case "LOW": low++; break;
+            }
+        }
+
+        foreach (var c in report.RealConflicts) Tally(c.Severity);
+        foreach (var c in report.TriggeredEffectConflicts) Tally(c.Severity);
+        // Contested entities only contribute MEDIUM/LOW risk
+        foreach (var e in report.ContestedEntities)
+        {
+            if (e.RiskLevel is "MEDIUM" or "LOW")
+                Tally(e.RiskLevel);
+        }
+
+        return new ConflictSummary
+        {
+            High = high,
+            Medium = medium,
+            Low = low,
+            TotalScore = high * 40 + medium * 25 + low * 10
+        };
     }
 }
 
@@ -30,6 +30,29 @@ public static class HarmonyConflictDetector
         return report;
     }
 
+    /// <summary>
+    /// Reads a json_group_array column. Names are returned exactly as stored, so
+    /// commas inside mod names or arg-type lists no longer split entries. NULL
+    /// inputs become null array elements and are dropped, as GROUP_CONCAT did.
+    /// </summary>
+    internal static List<string> ReadJsonList(SqliteDataReader reader, int ordinal)
+    {
+        if (reader.IsDBNull(ordinal))
+            return new List<string>();
+
+        var values = JsonSerializer.Deserialize<List<string?>>(reader.GetString(ordinal));
+        if (values == null)
+            return new List<string>();
+
+        var list = new List<string>(values.Count);
+        foreach (var value in values)
+        {
+            if (value != null)
+                list.Add(value);
+        }
+        return list;
+    }
+
     /// <summary>
     /// Detects multiple mods patching the same game method.
     /// Distinguishes between same-signature (HIGH) and different-overload (LOW) collisions.
@@ -44,11 +67,11 @@ public static class HarmonyConflictDetector
                 hp.target_class,
                 hp.target_method,
                 COUNT(DISTINCT hp.mod_id) as mod_count,
-                GROUP_CONCAT(DISTINCT m.name) as mods,
-                GROUP_CONCAT(DISTINCT hp.patch_type) as patch_types,
+                json_group_array(DISTINCT m.name) as mods,
+                json_group_array(DISTINCT hp.patch_type) as patch_types,
                 SUM(CASE WHEN hp.patch_type = 'Transpiler' THEN 1 ELSE 0 END) as transpiler_count,
                 SUM(CASE WHEN hp.returns_bool = 1 THEN 1 ELSE 0 END) as skip_capable_count,
-                GROUP_CONCAT(DISTINCT hp.target_arg_types) as arg_types_variants
+                json_group_array(DISTINCT hp.target_arg_types) as arg_types_variants
             FROM harmony_patches hp
             JOIN mods m ON hp.mod_id = m.id
             GROUP BY hp.target_class, hp.target_method
@@ -61,11 +84,11 @@ public static class HarmonyConflictDetector
             var targetClass = reader.GetString(0);
             var targetMethod = reader.GetString(1);
             var modCount = reader.GetInt32(2);
-            var modsStr = reader.GetString(3);
-            var patchTypesStr = reader.GetString(4);
+            var mods = ReadJsonList(reader, 3);
+            var patchTypes = ReadJsonList(reader, 4);
             var transpilerCount = reader.GetInt32(5);
             var skipCapableCount = reader.GetInt32(6);
-            var argTypesVariants = reader.IsDBNull(7) ? null : reader.GetString(7);
+            var argTypesVariants = ReadJsonList(reader, 7);
 
             // Determine severity based on conflict characteristics
             string severity;
@@ -79,7 +102,8 @@ public static class HarmonyConflictDetector
                 severity = "LOW";
 
             // Check if patches target different overloads (reduces severity)
-            var uniqueArgTypes = argTypesVariants?.Split(',').Where(s => !string.IsNullOrEmpty(s)).Distinct().Count() ?? 0;
+            // (whole arg-type lists, so "int,string" is one variant, not two)
+            var uniqueArgTypes = argTypesVariants.Count(s => !string.IsNullOrEmpty(s));
             if (uniqueArgTypes > 1 && severity != "CRITICAL")
             {
                 // Different overloads - reduce severity
@@ -90,8 +114,8 @@ public static class HarmonyConflictDetector
                 TargetClass: targetClass,
                 TargetMethod: targetMethod,
                 ModCount: modCount,
-                Mods: modsStr.Split(',').ToList(),
-                PatchTypes: patchTypesStr.Split(',').ToList(),
+                Mods: mods,
+                PatchTypes: patchTypes,
                 TranspilerCount: transpilerCount,
                 SkipCapableCount: skipCapableCount,
                 Severity: severity
@@ -115,7 +139,7 @@ public static class HarmonyConflictDetector
                 hp.target_class,
                 hp.target_method,
                 COUNT(*) as transpiler_count,
-                GROUP_CONCAT(m.name) as mods
+                json_group_array(m.name) as mods
             FROM harmony_patches hp
             JOIN mods m ON hp.mod_id = m.id
             WHERE hp.patch_type = 'Transpiler'
@@ -130,7 +154,7 @@ public static class HarmonyConflictDetector
                 TargetClass: reader.GetString(0),
                 TargetMethod: reader.GetString(1),
                 TranspilerCount: reader.GetInt32(2),
-                Mods: reader.GetString(3).Split(',').ToList(),
+                Mods: ReadJsonList(reader, 3),
                 Reason: "Multiple transpilers modifying same method IL - high chance of conflict"
             ));
         }
@@ -154,7 +178,7 @@ public static class HarmonyConflictDetector
                 m1.name as skip_mod,
                 hp1.patch_class as skip_class,
                 hp1.harmony_priority as skip_priority,
-                GROUP_CONCAT(DISTINCT m2.name) as affected_mods,
+                json_group_array(DISTINCT m2.name) as affected_mods,
                 COUNT(DISTINCT hp2.mod_id) as affected_count
             FROM harmony_patches hp1
             JOIN harmony_patches hp2 ON hp1.target_class = hp2.target_class
@@ -179,7 +203,7 @@ public static class HarmonyConflictDetector
                 SkipMod: reader.GetString(2),
                 SkipClass: reader.GetString(3),
                 SkipPriority: skipPriority,
-                AffectedMods: reader.GetString(5).Split(',').ToList(),
+                AffectedMods: ReadJsonList(reader, 5),
                 Severity: severity,
                 Reason: "Prefix can return false to skip original method and lower-priority patches"
             ));
@@ -67,9 +67,15 @@ public class IndirectConflictDetector
         conflicts.AddRange(DetectRelatedGroupModifications(db));    // L3
 
         result.ConflictsDetected = conflicts.Count;
-        result.HighCount = conflicts.Count(c => c.Severity == "high");
-        result.MediumCount = conflicts.Count(c => c.Severity == "medium");
-        result.LowCount = conflicts.Count(c => c.Severity == "low");
+        foreach (var c in conflicts)
+        {
+            switch (c.Severity)
+            {
+                case "high": result.HighCount++; break;
+                case "medium": result.MediumCount++; break;
+                case "low": result.LowCount++; break;
+            }
+        }
 
         // Bulk insert
         BulkInsertConflicts(db, conflicts);
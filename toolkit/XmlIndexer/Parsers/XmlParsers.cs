@@ -374,26 +374,30 @@ public class XmlParsers
         }
     }
 
+    // Properties whose value names another definition. Built once and shared: the
+    // lookup runs for every parsed property, and every reference from the same
+    // property reuses one context string instead of formatting a new one.
+    private static readonly Dictionary<string, (string TargetType, string Context)> ReferenceProps =
+        new (string Name, string TargetType)[]
+        {
+            ("Extends", "item"),
+            ("HandItem", "item"),
+            ("BuffOnEat", "buff"),
+            ("BuffOnExecute", "buff"),
+            ("SpawnEntityName", "entity_class"),
+            ("SoundIdle", "sound"),
+            ("SoundDeath", "sound"),
+            ("SoundAttack", "sound"),
+            ("SoundRandom", "sound"),
+            ("LootListOnDeath", "loot_group"),
+        }.ToDictionary(p => p.Name, p => (p.TargetType, $"property:{p.Name}"));
+
     private void TrackPropertyReferences(long defId, string propName, string? value, int line, string fileName)
     {
         if (string.IsNullOrEmpty(value)) return;
 
-        var referenceProps = new Dictionary<string, string>
-        {
-            { "Extends", "item" },
-            { "HandItem", "item" },
-            { "BuffOnEat", "buff" },
-            { "BuffOnExecute", "buff" },
-            { "SpawnEntityName", "entity_class" },
-            { "SoundIdle", "sound" },
-            { "SoundDeath", "sound" },
-            { "SoundAttack", "sound" },
-            { "SoundRandom", "sound" },
-            { "LootListOnDeath", "loot_group" },
-        };
-
-        if (referenceProps.TryGetValue(propName, out var targetType))
-            AddReference("xml", defId, fileName, line, targetType, value, $"property:{propName}");
+        if (ReferenceProps.TryGetValue(propName, out var reference))
+            AddReference("xml", defId, fileName, line, reference.TargetType, value, reference.Context);
     }
 
     // ==========================================================================
@@ -1452,8 +1452,8 @@ public class Program
         foreach (var modDir in modDirs)
         {
             var hasXml = Directory.Exists(Path.Combine(modDir, "Config")) && 
-                         Directory.GetFiles(Path.Combine(modDir, "Config"), "*.xml").Length > 0;
-            var hasDll = Directory.GetFiles(modDir, "*.dll", SearchOption.AllDirectories)
+                         Directory.EnumerateFiles(Path.Combine(modDir, "Config"), "*.xml").Any();
+            var hasDll = Directory.EnumerateFiles(modDir, "*.dll", SearchOption.AllDirectories)
                          .Any(d => !Path.GetFileName(d).StartsWith("0Harmony") && 
                                    !Path.GetFileName(d).Contains("Mono.Cecil"));
 
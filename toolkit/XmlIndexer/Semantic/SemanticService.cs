@@ -2,6 +2,9 @@ using System;
 using System.Collections.Generic;
 using System.IO;
 using System.Linq;
+using System.Text;
+using System.Text.Encodings.Web;
+using System.Text.Json;
 using Microsoft.Data.Sqlite;
 using XmlIndexer.Models;
 
@@ -30,6 +33,15 @@ public class SemanticService
         using var db = new SqliteConnection($"Data Source={_dbPath}");
         db.Open();
 
+        // Export only reads: larger page cache, mmap'd reads, and in-memory temp
+        // b-trees for the GROUP BY / ORDER BY scans below
+        using (var pragma = db.CreateCommand())
+        {
+            pragma.CommandText = @"PRAGMA query_only=1; PRAGMA cache_size=-65536;
+                                   PRAGMA mmap_size=268435456; PRAGMA temp_store=MEMORY;";
+            pragma.ExecuteNonQuery();
+        }
+
         // Load existing mappings to skip already-completed items (enables batch processing)
         var existingMappings = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
         try
@@ -51,8 +63,6 @@ public class SemanticService
         }
         catch { /* Table doesn't exist yet */ }
 
-        var traces = new List<SemanticTrace>();
-
         // Filter function to skip already-mapped items
         bool ShouldInclude(SemanticTrace trace)
         {
@@ -60,48 +70,43 @@ public class SemanticService
             return !existingMappings.Contains(key);
         }
 
-        // 1. ALL unique property names (the building blocks)
-        Console.WriteLine("Collecting ALL property names...");
-        var propNames = CollectAllPropertyNames(db).Where(ShouldInclude).ToList();
-        traces.AddRange(propNames);
-        Console.WriteLine($"  Found {propNames.Count} unique property names");
-
-        // 2. ALL definitions (items, blocks, buffs, entities, etc.)
-        Console.WriteLine("Collecting ALL definitions (items, blocks, buffs, etc.)...");
-        var definitions = CollectAllDefinitions(db).Where(ShouldInclude).ToList();
-        traces.AddRange(definitions);
-        Console.WriteLine($"  Found {definitions.Count} definitions");
-
-        // 3. ALL cross-reference patterns
-        Console.WriteLine("Collecting cross-reference patterns...");
-        var crossRefs = CollectAllCrossReferences(db).Where(ShouldInclude).ToList();
-        traces.AddRange(crossRefs);
-        Console.WriteLine($"  Found {crossRefs.Count} reference patterns");
-
-        // 4. Definition type summaries
-        Console.WriteLine("Collecting definition type summaries...");
-        var defTypes = CollectAllDefinitionTypes(db).Where(ShouldInclude).ToList();
-        traces.AddRange(defTypes);
-        Console.WriteLine($"  Found {defTypes.Count} definition types");
-
-        // 5. C# Classes (from mod analysis)
-        Console.WriteLine("Collecting C# class definitions...");
-        var csharpClasses = CollectCSharpClassTraces(db).Where(ShouldInclude).ToList();
-        traces.AddRange(csharpClasses);
-        Console.WriteLine($"  Found {csharpClasses.Count} unique C# classes");
-
-        // Write JSONL output
-        Console.WriteLine($"\nWriting {traces.Count} traces to {outputPath}...");
-        using var writer = new StreamWriter(outputPath);
-        foreach (var trace in traces)
+        // Collectors stream rows straight into the JSONL writer, so only the
+        // trace currently being written is held in memory.
+        var total = 0;
+        using (var stream = new FileStream(outputPath, FileMode.Create, FileAccess.Write, FileShare.None, 1 << 20))
         {
-            var json = SerializeTrace(trace);
-            writer.WriteLine(json);
+            int Write(IEnumerable<SemanticTrace> traces)
+            {
+                var count = WriteTraceLines(stream, traces.Where(ShouldInclude));
+                total += count;
+                return count;
+            }
+
+            // 1. ALL unique property names (the building blocks)
+            Console.WriteLine("Collecting ALL property names...");
+            Console.WriteLine($"  Found {Write(CollectAllPropertyNames(db))} unique property names");
+
+            // 2. ALL definitions (items, blocks, buffs, entities, etc.)
+            Console.WriteLine("Collecting ALL definitions (items, blocks, buffs, etc.)...");
+            Console.WriteLine($"  Found {Write(CollectAllDefinitions(db))} definitions");
+
+            // 3. ALL cross-reference patterns
+            Console.WriteLine("Collecting cross-reference patterns...");
+            Console.WriteLine($"  Found {Write(CollectAllCrossReferences(db))} reference patterns");
+
+            // 4. Definition type summaries
+            Console.WriteLine("Collecting definition type summaries...");
+            Console.WriteLine($"  Found {Write(CollectAllDefinitionTypes(db))} definition types");
+
+            // 5. C# Classes (from mod analysis)
+            Console.WriteLine("Collecting C# class definitions...");
+            Console.WriteLine($"  Found {Write(CollectCSharpClassTraces(db))} unique C# classes");
         }
 
+        Console.WriteLine($"\nWrote {total} traces to {outputPath}");
         Console.WriteLine();
         Console.WriteLine("╔══════════════════════════════════════════════════════════════════╗");
-        Console.WriteLine($"║  EXPORTED {traces.Count,5} TRACES                                       ║");
+        Console.WriteLine($"║  EXPORTED {total,5} TRACES                                       ║");
         Console.WriteLine("╚══════════════════════════════════════════════════════════════════╝");
         Console.WriteLine();
         Console.WriteLine("Next steps:");
@@ -152,6 +157,22 @@ public class SemanticService
         var imported = 0;
         var skipped = 0;
 
+        // One transaction and one prepared insert for the whole file; in autocommit
+        // mode every mapping would be its own journal commit.
+        using var transaction = db.BeginTransaction();
+        using var insert = db.CreateCommand();
+        insert.CommandText = @"INSERT OR REPLACE INTO semantic_mappings 
+            (entity_type, entity_name, parent_context, layman_description, technical_description, 
+             player_impact, generated_by, confidence, llm_model)
+            VALUES ($type, $name, $parent, $layman, $technical, $impact, 'llm', 0.8, $model)";
+        var pType = insert.Parameters.Add("$type", SqliteType.Text);
+        var pName = insert.Parameters.Add("$name", SqliteType.Text);
+        var pParent = insert.Parameters.Add("$parent", SqliteType.Text);
+        var pLayman = insert.Parameters.Add("$layman", SqliteType.Text);
+        var pTechnical = insert.Parameters.Add("$technical", SqliteType.Text);
+        var pImpact = insert.Parameters.Add("$impact", SqliteType.Text);
+        var pModel = insert.Parameters.Add("$model", SqliteType.Text);
+
         using var streamReader = new StreamReader(inputPath);
         string? line;
         while ((line = streamReader.ReadLine()) != null)
@@ -168,19 +189,14 @@ public class SemanticService
                     continue;
                 }
 
-                using var cmd = db.CreateCommand();
-                cmd.CommandText = @"INSERT OR REPLACE INTO semantic_mappings 
-                    (entity_type, entity_name, parent_context, layman_description, technical_description, 
-                     player_impact, generated_by, confidence, llm_model)
-                    VALUES ($type, $name, $parent, $layman, $technical, $impact, 'llm', 0.8, $model)";
-                cmd.Parameters.AddWithValue("$type", mapping.Value.type);
-                cmd.Parameters.AddWithValue("$name", mapping.Value.name);
-                cmd.Parameters.AddWithValue("$parent", mapping.Value.parent ?? (object)DBNull.Value);
-                cmd.Parameters.AddWithValue("$layman", mapping.Value.layman);
-                cmd.Parameters.AddWithValue("$technical", mapping.Value.technical ?? (object)DBNull.Value);
-                cmd.Parameters.AddWithValue("$impact", mapping.Value.impact ?? (object)DBNull.Value);
-                cmd.Parameters.AddWithValue("$model", mapping.Value.model ?? (object)DBNull.Value);
-                cmd.ExecuteNonQuery();
+                pType.Value = mapping.Value.type;
+                pName.Value = mapping.Value.name;
+                pParent.Value = mapping.Value.parent ?? (object)DBNull.Value;
+                pLayman.Value = mapping.Value.layman;
+                pTechnical.Value = mapping.Value.technical ?? (object)DBNull.Value;
+                pImpact.Value = mapping.Value.impact ?? (object)DBNull.Value;
+                pModel.Value = mapping.Value.model ?? (object)DBNull.Value;
+                insert.ExecuteNonQuery();
                 imported++;
             }
             catch
@@ -189,6 +205,8 @@ public class SemanticService
             }
         }
 
+        transaction.Commit();
+
         Console.WriteLine($"  Imported: {imported} mappings");
         Console.WriteLine($"  Skipped:  {skipped} (no description or parse error)");
 
@@ -251,11 +269,9 @@ public class SemanticService
     // COMPREHENSIVE TRACE COLLECTORS - Captures ALL entities from database
     // =========================================================================
 
-    private List<SemanticTrace> CollectAllPropertyNames(SqliteConnection db)
+    private IEnumerable<SemanticTrace> CollectAllPropertyNames(SqliteConnection db)
     {
         // Get ALL unique property names with usage counts
-        var traces = new List<SemanticTrace>();
-        
         using var cmd = db.CreateCommand();
         cmd.CommandText = @"
             SELECT 
@@ -287,7 +303,7 @@ public class SemanticService
 Sample values seen:
 {sampleValues}";
 
-            traces.Add(new SemanticTrace(
+            yield return new SemanticTrace(
                 EntityType: "property_name",
                 EntityName: propName,
                 ParentContext: usedInTypes,
@@ -295,28 +311,28 @@ Sample values seen:
                 UsageExamples: $"Used {usageCount} times in {usedInTypes}",
                 RelatedEntities: null,
                 GameContext: InferPropertyGameContext(propName)
-            ));
+            );
         }
-
-        return traces;
     }
 
-    private List<SemanticTrace> CollectAllDefinitions(SqliteConnection db)
+    private IEnumerable<SemanticTrace> CollectAllDefinitions(SqliteConnection db)
     {
         // Get ALL definitions (items, blocks, buffs, etc.) - the 15,534 entities
-        var traces = new List<SemanticTrace>();
-        
         using var cmd = db.CreateCommand();
         cmd.CommandText = @"
             SELECT 
                 d.definition_type,
                 d.name,
                 d.extends,
-                COUNT(p.id) as prop_count,
-                GROUP_CONCAT(p.property_name || '=' || COALESCE(SUBSTR(p.property_value, 1, 30), ''), '; ') as props
+                (SELECT COUNT(*) FROM xml_properties p WHERE p.definition_id = d.id) as prop_count,
+                -- Only the properties shown in the trace preview are concatenated
+                (SELECT GROUP_CONCAT(prop, '; ') FROM (
+                    SELECT p.property_name || '=' || COALESCE(SUBSTR(p.property_value, 1, 30), '') as prop
+                    FROM xml_properties p
+                    WHERE p.definition_id = d.id
+                    ORDER BY p.id
+                    LIMIT 8)) as props
             FROM xml_definitions d
-            LEFT JOIN xml_properties p ON d.id = p.definition_id
-            GROUP BY d.id
             ORDER BY d.definition_type, d.name";
 
         using var reader = cmd.ExecuteReader();
@@ -338,7 +354,7 @@ Sample values seen:
   <!-- ... {propCount} total properties -->
 </{defType}>";
 
-            traces.Add(new SemanticTrace(
+            yield return new SemanticTrace(
                 EntityType: "definition",
                 EntityName: name,
                 ParentContext: defType,
@@ -346,17 +362,13 @@ Sample values seen:
                 UsageExamples: extends != null ? $"Extends {extends}" : null,
                 RelatedEntities: extends,
                 GameContext: InferDefinitionGameContext(defType, name)
-            ));
+            );
         }
-
-        return traces;
     }
 
-    private List<SemanticTrace> CollectAllCrossReferences(SqliteConnection db)
+    private IEnumerable<SemanticTrace> CollectAllCrossReferences(SqliteConnection db)
     {
         // Get unique reference PATTERNS (not all 47k refs, but the types of relationships)
-        var traces = new List<SemanticTrace>();
-        
         using var cmd = db.CreateCommand();
         cmd.CommandText = @"
             SELECT 
@@ -391,7 +403,7 @@ When a {sourceType} references a {targetType} via '{refContext}':
   - Target type: {targetType} (what is being referenced)
   - Example targets: {sampleTargets}";
 
-            traces.Add(new SemanticTrace(
+            yield return new SemanticTrace(
                 EntityType: "cross_reference_pattern",
                 EntityName: relationshipName,
                 ParentContext: refContext,
@@ -399,17 +411,13 @@ When a {sourceType} references a {targetType} via '{refContext}':
                 UsageExamples: $"{refCount} occurrences",
                 RelatedEntities: sampleTargets,
                 GameContext: $"{sourceType} → {targetType} relationships"
-            ));
+            );
         }
-
-        return traces;
     }
 
-    private List<SemanticTrace> CollectAllDefinitionTypes(SqliteConnection db)
+    private IEnumerable<SemanticTrace> CollectAllDefinitionTypes(SqliteConnection db)
     {
         // Get summary of each definition TYPE (item, block, buff, etc.)
-        var traces = new List<SemanticTrace>();
-        
         using var cmd = db.CreateCommand();
         cmd.CommandText = @"
             SELECT 
@@ -440,7 +448,7 @@ Sample {defType} names:
 When a mod modifies a '{defType}', it typically affects:
 - [TO BE FILLED BY LLM: What gameplay aspect does this affect?]";
 
-            traces.Add(new SemanticTrace(
+            yield return new SemanticTrace(
                 EntityType: "definition_type",
                 EntityName: defType,
                 ParentContext: null,
@@ -448,15 +456,12 @@ When a mod modifies a '{defType}', it typically affects:
                 UsageExamples: $"{count} definitions exist",
                 RelatedEntities: null,
                 GameContext: InferDefinitionTypeContext(defType)
-            ));
+            );
         }
-
-        return traces;
     }
 
-    private List<SemanticTrace> CollectCSharpClassTraces(SqliteConnection db)
+    private IEnumerable<SemanticTrace> CollectCSharpClassTraces(SqliteConnection db)
     {
-        var traces = new List<SemanticTrace>();
         var classMethods = new Dictionary<string, List<string>>();
 
         // Get unique class names and their methods from mod_csharp_deps
@@ -502,7 +507,7 @@ public class {className}
 {methodList}
 }}";
 
-            traces.Add(new SemanticTrace(
+            yield return new SemanticTrace(
                 EntityType: "csharp_class",
                 EntityName: className,
                 ParentContext: null,
@@ -510,10 +515,8 @@ public class {className}
                 UsageExamples: "Patched by mods via Harmony",
                 RelatedEntities: methods.Count > 0 ? string.Join(", ", methods.Take(5)) : null,
                 GameContext: gameContext
-            ));
+            );
         }
-
-        return traces;
     }
 
     // =========================================================================
@@ -527,41 +530,83 @@ public class {className}
         return $"name=\"{parts[0]}\" value=\"{(parts.Length > 1 ? parts[1] : "")}\"";
     }
 
+    // Keyword -> context tables for the Infer* helpers. Checked in order against the
+    // lowercased name; the first entry with any matching keyword wins.
+    private static readonly (string[] Keywords, string Context)[] PropertyContexts =
+    {
+        (new[] { "damage", "attack", "weapon" }, "Combat"),
+        (new[] { "health", "stamina", "food", "water" }, "Survival/Stats"),
+        (new[] { "craft", "recipe", "ingredient" }, "Crafting"),
+        (new[] { "loot", "harvest", "drop" }, "Loot/Harvesting"),
+        (new[] { "speed", "move", "jump" }, "Movement"),
+        (new[] { "sound", "audio", "noise" }, "Audio"),
+        (new[] { "light", "glow", "emit" }, "Lighting/Visual"),
+        (new[] { "unlock", "require", "perk", "skill" }, "Progression"),
+        (new[] { "price", "value", "economic" }, "Economy"),
+        (new[] { "buff", "effect", "modifier" }, "Buffs/Effects"),
+        (new[] { "spawn", "probability", "chance" }, "Spawning/RNG"),
+        (new[] { "block", "material", "durability" }, "Blocks/Building"),
+        (new[] { "vehicle", "fuel" }, "Vehicles"),
+        (new[] { "zombie", "entity", "ai" }, "Entities/AI"),
+    };
+
+    private static readonly (string[] Keywords, string Context)[] DefinitionNameContexts =
+    {
+        (new[] { "zombie", "spider", "wolf" }, "Enemies"),
+        (new[] { "gun", "pistol", "rifle", "shotgun" }, "Ranged Weapons"),
+        (new[] { "axe", "machete", "club", "knife" }, "Melee Weapons"),
+        (new[] { "armor", "helmet", "chest", "boots" }, "Armor"),
+        (new[] { "food", "water", "drink", "can" }, "Food/Drink"),
+        (new[] { "medical", "bandage", "first", "antibiotic" }, "Medical"),
+        (new[] { "ammo", "bullet", "shell", "arrow" }, "Ammunition"),
+    };
+
+    // Class names are split around the item+action check, which needs both keywords
+    private static readonly (string[] Keywords, string Context)[] ClassNameContexts =
+    {
+        (new[] { "inventory", "bag", "backpack" }, "Inventory System"),
+        (new[] { "craft", "recipe" }, "Crafting System"),
+        (new[] { "trader", "vending" }, "Trading System"),
+        (new[] { "vehicle" }, "Vehicle System"),
+        (new[] { "zombie", "enemy", "entity" }, "Entity/AI System"),
+    };
+
+    private static readonly (string[] Keywords, string Context)[] ClassNameContextsAfterItemAction =
+    {
+        (new[] { "xui", "gui", "hud" }, "User Interface"),
+        (new[] { "buff", "effect" }, "Buff/Effect System"),
+        (new[] { "spawn", "director" }, "Spawning System"),
+        (new[] { "loot", "container" }, "Loot System"),
+        (new[] { "block" }, "Block System"),
+        (new[] { "world", "chunk" }, "World System"),
+        (new[] { "player" }, "Player System"),
+        (new[] { "audio", "sound" }, "Audio System"),
+        (new[] { "net", "server", "client" }, "Networking"),
+    };
+
+    private static string? MatchContext(string lower, (string[] Keywords, string Context)[] table)
+    {
+        foreach (var (keywords, context) in table)
+        {
+            foreach (var keyword in keywords)
+            {
+                if (lower.Contains(keyword, StringComparison.Ordinal))
+                    return context;
+            }
+        }
+        return null;
+    }
+
     private static string InferPropertyGameContext(string propName)
     {
-        var lower = propName.ToLower();
-        if (lower.Contains("damage") || lower.Contains("attack") || lower.Contains("weapon")) return "Combat";
-        if (lower.Contains("health") || lower.Contains("stamina") || lower.Contains("food") || lower.Contains("water")) return "Survival/Stats";
-        if (lower.Contains("craft") || lower.Contains("recipe") || lower.Contains("ingredient")) return "Crafting";
-        if (lower.Contains("loot") || lower.Contains("harvest") || lower.Contains("drop")) return "Loot/Harvesting";
-        if (lower.Contains("speed") || lower.Contains("move") || lower.Contains("jump")) return "Movement";
-        if (lower.Contains("sound") || lower.Contains("audio") || lower.Contains("noise")) return "Audio";
-        if (lower.Contains("light") || lower.Contains("glow") || lower.Contains("emit")) return "Lighting/Visual";
-        if (lower.Contains("unlock") || lower.Contains("require") || lower.Contains("perk") || lower.Contains("skill")) return "Progression";
-        if (lower.Contains("price") || lower.Contains("value") || lower.Contains("economic")) return "Economy";
-        if (lower.Contains("buff") || lower.Contains("effect") || lower.Contains("modifier")) return "Buffs/Effects";
-        if (lower.Contains("spawn") || lower.Contains("probability") || lower.Contains("chance")) return "Spawning/RNG";
-        if (lower.Contains("block") || lower.Contains("material") || lower.Contains("durability")) return "Blocks/Building";
-        if (lower.Contains("vehicle") || lower.Contains("fuel")) return "Vehicles";
-        if (lower.Contains("zombie") || lower.Contains("entity") || lower.Contains("ai")) return "Entities/AI";
-        return "Game Property";
+        return MatchContext(propName.ToLowerInvariant(), PropertyContexts) ?? "Game Property";
     }
 
     private static string InferDefinitionGameContext(string defType, string name)
     {
-        var context = InferDefinitionTypeContext(defType);
-        var nameLower = name.ToLower();
-        
-        // Add specifics based on name patterns
-        if (nameLower.Contains("zombie") || nameLower.Contains("spider") || nameLower.Contains("wolf")) return "Enemies";
-        if (nameLower.Contains("gun") || nameLower.Contains("pistol") || nameLower.Contains("rifle") || nameLower.Contains("shotgun")) return "Ranged Weapons";
-        if (nameLower.Contains("axe") || nameLower.Contains("machete") || nameLower.Contains("club") || nameLower.Contains("knife")) return "Melee Weapons";
-        if (nameLower.Contains("armor") || nameLower.Contains("helmet") || nameLower.Contains("chest") || nameLower.Contains("boots")) return "Armor";
-        if (nameLower.Contains("food") || nameLower.Contains("water") || nameLower.Contains("drink") || nameLower.Contains("can")) return "Food/Drink";
-        if (nameLower.Contains("medical") || nameLower.Contains("bandage") || nameLower.Contains("first") || nameLower.Contains("antibiotic")) return "Medical";
-        if (nameLower.Contains("ammo") || nameLower.Contains("bullet") || nameLower.Contains("shell") || nameLower.Contains("arrow")) return "Ammunition";
-        
-        return context;
+        // Add specifics based on name patterns, else fall back to the type's context
+        return MatchContext(name.ToLowerInvariant(), DefinitionNameContexts)
+            ?? InferDefinitionTypeContext(defType);
     }
 
     private static string InferDefinitionTypeContext(string defType)
@@ -589,91 +634,93 @@ public class {className}
 
     private static string InferGameContextFromClassName(string className)
     {
-        var lower = className.ToLower();
-        if (lower.Contains("inventory") || lower.Contains("bag") || lower.Contains("backpack")) return "Inventory System";
-        if (lower.Contains("craft") || lower.Contains("recipe")) return "Crafting System";
-        if (lower.Contains("trader") || lower.Contains("vending")) return "Trading System";
-        if (lower.Contains("vehicle")) return "Vehicle System";
-        if (lower.Contains("zombie") || lower.Contains("enemy") || lower.Contains("entity")) return "Entity/AI System";
-        if (lower.Contains("item") && lower.Contains("action")) return "Item Actions";
-        if (lower.Contains("xui") || lower.Contains("gui") || lower.Contains("hud")) return "User Interface";
-        if (lower.Contains("buff") || lower.Contains("effect")) return "Buff/Effect System";
-        if (lower.Contains("spawn") || lower.Contains("director")) return "Spawning System";
-        if (lower.Contains("loot") || lower.Contains("container")) return "Loot System";
-        if (lower.Contains("block")) return "Block System";
-        if (lower.Contains("world") || lower.Contains("chunk")) return "World System";
-        if (lower.Contains("player")) return "Player System";
-        if (lower.Contains("audio") || lower.Contains("sound")) return "Audio System";
-        if (lower.Contains("net") || lower.Contains("server") || lower.Contains("client")) return "Networking";
-        return "Game Core";
+        var lower = className.ToLowerInvariant();
+        return MatchContext(lower, ClassNameContexts)
+            ?? (lower.Contains("item") && lower.Contains("action") ? "Item Actions" : null)
+            ?? MatchContext(lower, ClassNameContextsAfterItemAction)
+            ?? "Game Core";
+    }
+
+    // Non-ASCII text is kept as-is for readability
+    private static readonly JsonWriterOptions TraceJsonOptions = new()
+    {
+        Encoder = JavaScriptEncoder.UnsafeRelaxedJsonEscaping
+    };
+
+    /// <summary>
+    /// Writes one trace object per line (JSONL) and returns the number of lines written.
+    /// </summary>
+    internal static int WriteTraceLines(Stream stream, IEnumerable<SemanticTrace> traces)
+    {
+        using var json = new Utf8JsonWriter(stream, TraceJsonOptions);
+        var count = 0;
+        foreach (var trace in traces)
+        {
+            WriteTrace(json, trace);
+            json.Flush();   // into the stream's buffer, not to disk
+            json.Reset();   // each line is its own document - no ',' before the next object
+            stream.WriteByte((byte)'\n');
+            count++;
+        }
+        return count;
     }
 
-    private string SerializeTrace(SemanticTrace trace)
+    private static void WriteTrace(Utf8JsonWriter json, SemanticTrace trace)
     {
-        var sb = new System.Text.StringBuilder();
-        sb.Append("{");
-        sb.Append($"\"entity_type\":\"{EscapeJson(trace.EntityType)}\",");
-        sb.Append($"\"entity_name\":\"{EscapeJson(trace.EntityName)}\",");
-        sb.Append($"\"parent_context\":{(trace.ParentContext != null ? $"\"{EscapeJson(trace.ParentContext)}\"" : "null")},");
-        sb.Append($"\"code_trace\":\"{EscapeJson(trace.CodeTrace)}\",");
-        sb.Append($"\"usage_examples\":{(trace.UsageExamples != null ? $"\"{EscapeJson(trace.UsageExamples)}\"" : "null")},");
-        sb.Append($"\"related_entities\":{(trace.RelatedEntities != null ? $"\"{EscapeJson(trace.RelatedEntities)}\"" : "null")},");
-        sb.Append($"\"game_context\":{(trace.GameContext != null ? $"\"{EscapeJson(trace.GameContext)}\"" : "null")},");
+        json.WriteStartObject();
+        json.WriteString("entity_type", trace.EntityType);
+        json.WriteString("entity_name", trace.EntityName);
+        json.WriteString("parent_context", trace.ParentContext);
+        json.WriteString("code_trace", trace.CodeTrace);
+        json.WriteString("usage_examples", trace.UsageExamples);
+        json.WriteString("related_entities", trace.RelatedEntities);
+        json.WriteString("game_context", trace.GameContext);
         // Fields for LLM to fill in:
-        sb.Append("\"layman_description\":null,");
-        sb.Append("\"technical_description\":null,");
-        sb.Append("\"player_impact\":null");
-        sb.Append("}");
-        return sb.ToString();
+        json.WriteNull("layman_description");
+        json.WriteNull("technical_description");
+        json.WriteNull("player_impact");
+        json.WriteEndObject();
     }
 
-    private static string EscapeJson(string s) => s
-        .Replace("\\", "\\\\")
-        .Replace("\"", "\\\"")
-        .Replace("\r", "\\r")
-        .Replace("\n", "\\n")
-        .Replace("\t", "\\t");
+    // Top-level keys read from each mapping line, in the order ParseMappingJson returns them
+    private static readonly string[] MappingKeys =
+    {
+        "entity_type", "entity_name", "parent_context", "layman_description",
+        "technical_description", "player_impact", "llm_model"
+    };
 
-    private (string type, string name, string? parent, string? layman, string? technical, string? impact, string? model)? 
+    internal static (string type, string name, string? parent, string? layman, string? technical, string? impact, string? model)? 
         ParseMappingJson(string json)
     {
-        // Simple JSON parsing for our known format
-        string? GetValue(string key)
+        // Single forward pass over the line with the UTF-8 reader; malformed lines throw JsonException
+        var values = new string?[MappingKeys.Length];
+        var reader = new Utf8JsonReader(Encoding.UTF8.GetBytes(json));
+
+        if (!reader.Read() || reader.TokenType != JsonTokenType.StartObject) return null;
+
+        while (reader.Read() && reader.TokenType == JsonTokenType.PropertyName)
         {
-            var pattern = $"\"{key}\":";
-            var idx = json.IndexOf(pattern);
-            if (idx < 0) return null;
-            idx += pattern.Length;
-            
-            // Skip whitespace
-            while (idx < json.Length && char.IsWhiteSpace(json[idx])) idx++;
-            
-            if (idx >= json.Length) return null;
-            if (json[idx] == 'n') return null; // null
-            if (json[idx] != '"') return null;
-            
-            idx++; // skip opening quote
-            var end = idx;
-            while (end < json.Length && json[end] != '"')
+            var slot = -1;
+            for (int i = 0; i < MappingKeys.Length && slot < 0; i++)
             {
-                if (json[end] == '\\') end++; // skip escaped char
-                end++;
+                if (reader.ValueTextEquals(MappingKeys[i])) slot = i;
+            }
+            reader.Read();
+
+            if (reader.TokenType == JsonTokenType.String)
+            {
+                if (slot >= 0) values[slot] = reader.GetString();
+            }
+            else
+            {
+                reader.Skip(); // null, numbers, or nested objects/arrays
             }
-            
-            return json.Substring(idx, end - idx).Replace("\\n", "\n").Replace("\\\"", "\"");
         }
 
-        var type = GetValue("entity_type");
-        var name = GetValue("entity_name");
+        var type = values[0];
+        var name = values[1];
         if (type == null || name == null) return null;
 
-        return (
-            type, name,
-            GetValue("parent_context"),
-            GetValue("layman_description"),
-            GetValue("technical_description"),
-            GetValue("player_impact"),
-            GetValue("llm_model")
-        );
+        return (type, name, values[2], values[3], values[4], values[5], values[6]);
     }
 }
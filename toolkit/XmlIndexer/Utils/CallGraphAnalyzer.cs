@@ -77,25 +77,57 @@ public class CallGraphAnalyzer
 
         var csFiles = Directory.GetFiles(codebasePath, "*.cs", SearchOption.AllDirectories);
 
+        // Reading, hashing and pattern matching are independent per file, so scan in parallel;
+        // the connection is not thread-safe, so results are persisted afterwards in file order.
+        var scans = new FileScan?[csFiles.Length];
+        Parallel.For(0, csFiles.Length, i =>
+        {
+            try
+            {
+                scans[i] = ScanFile(csFiles[i], forceReanalyze);
+            }
+            catch (Exception ex)
+            {
+                // Silent - don't break on individual file failures
+                System.Diagnostics.Debug.WriteLine($"CallGraph warning: {Path.GetFileName(csFiles[i])}: {ex.Message}");
+            }
+        });
+
         using var transaction = _db.BeginTransaction();
 
-        foreach (var file in csFiles)
+        foreach (var scan in scans)
         {
+            if (scan == null)
+                continue;
+
+            if (scan.Calls == null)
+            {
+                FilesSkipped++;
+                continue;
+            }
+
             try
             {
-                AnalyzeFile(file, forceReanalyze);
+                PersistFileScan(scan);
             }
             catch (Exception ex)
             {
-                // Silent - don't break on individual file failures
-                System.Diagnostics.Debug.WriteLine($"CallGraph warning: {Path.GetFileName(file)}: {ex.Message}");
+                System.Diagnostics.Debug.WriteLine($"CallGraph warning: {Path.GetFileName(scan.FilePath)}: {ex.Message}");
             }
         }
 
         transaction.Commit();
     }
 
-    private void AnalyzeFile(string filePath, bool forceReanalyze)
+    /// <summary>
+    /// Calls found in one file. Calls is null when the file is unchanged since the last run.
+    /// </summary>
+    private record FileScan(string FilePath, string Hash, List<FoundCall>? Calls);
+
+    private record FoundCall(
+        string CallerClass, string CallerMethod, string TargetClass, string TargetMethod, int LineNumber, string CodeSnippet);
+
+    private FileScan ScanFile(string filePath, bool forceReanalyze)
     {
         var content = File.ReadAllText(filePath);
         var hash = ComputeHash(content);
@@ -103,32 +135,14 @@ public class CallGraphAnalyzer
         // Check if file has changed
         if (!forceReanalyze && _fileHashes.TryGetValue(filePath, out var existingHash) && existingHash == hash)
         {
-            FilesSkipped++;
-            return;
+            return new FileScan(filePath, hash, null);
         }
 
-        // Clear existing calls for this file
-        ClearFileCalls(filePath);
-
+        var calls = new List<FoundCall>();
         var lines = content.Split('\n');
         var currentClass = ExtractClassName(content);
         var currentMethod = "";
 
-        // Pattern for method declarations
-        var methodDeclPattern = new Regex(
-            @"(?:public|private|protected|internal)\s+(?:static\s+)?(?:virtual\s+)?(?:override\s+)?(?:async\s+)?(?:\w+(?:<[^>]+>)?)\s+(\w+)\s*\(",
-            RegexOptions.Compiled);
-
-        // Pattern for method calls: ClassName.MethodName( or just MethodName(
-        var methodCallPattern = new Regex(
-            @"(?:(\w+)\.)?(\w+)\s*\(",
-            RegexOptions.Compiled);
-
-        // Pattern for static method calls: ClassName.MethodName(
-        var staticCallPattern = new Regex(
-            @"([A-Z]\w+)\.(\w+)\s*\(",
-            RegexOptions.Compiled);
-
         for (int i = 0; i < lines.Length; i++)
         {
             var line = lines[i];
@@ -139,14 +153,14 @@ public class CallGraphAnalyzer
                 continue;
 
             // Track current method
-            var methodDecl = methodDeclPattern.Match(line);
+            var methodDecl = MethodDeclPattern.Match(line);
             if (methodDecl.Success)
             {
                 currentMethod = methodDecl.Groups[1].Value;
             }
 
             // Find static method calls (ClassName.Method pattern)
-            foreach (Match match in staticCallPattern.Matches(line))
+            foreach (Match match in StaticCallPattern.Matches(line))
             {
                 var targetClass = match.Groups[1].Value;
                 var targetMethod = match.Groups[2].Value;
@@ -160,40 +174,68 @@ public class CallGraphAnalyzer
                 if (beforeMatch.EndsWith("(") || beforeMatch.EndsWith("<") || beforeMatch.EndsWith("new "))
                     continue;
 
-                PersistMethodCall(filePath, currentClass, currentMethod, targetClass, targetMethod, 
-                    "static", i + 1, GetCodeSnippet(lines, i), hash);
-                MethodCallsFound++;
+                calls.Add(new FoundCall(currentClass, currentMethod, targetClass, targetMethod,
+                    i + 1, GetCodeSnippet(lines, i)));
             }
         }
 
-        _fileHashes[filePath] = hash;
-        FilesAnalyzed++;
+        return new FileScan(filePath, hash, calls);
     }
 
-    private static bool IsCommonFalsePositive(string className, string methodName)
+    private void PersistFileScan(FileScan scan)
     {
-        // Skip common system/framework calls that aren't interesting
-        var skipClasses = new HashSet<string>(StringComparer.OrdinalIgnoreCase)
-        {
-            "Console", "Debug", "Log", "String", "Math", "Mathf", "Convert",
-            "int", "float", "double", "bool", "string", "object", "Array",
-            "List", "Dictionary", "HashSet", "StringBuilder", "Regex",
-            "Path", "File", "Directory", "Environment", "Type", "Activator"
-        };
+        // Clear existing calls for this file
+        ClearFileCalls(scan.FilePath);
 
-        var skipMethods = new HashSet<string>(StringComparer.OrdinalIgnoreCase)
+        foreach (var call in scan.Calls!)
         {
-            "ToString", "GetType", "Equals", "GetHashCode", "CompareTo",
-            "Parse", "TryParse", "Format", "Join", "Split", "Contains",
-            "Add", "Remove", "Clear", "Count", "Length"
-        };
+            PersistMethodCall(scan.FilePath, call.CallerClass, call.CallerMethod, call.TargetClass, call.TargetMethod,
+                "static", call.LineNumber, call.CodeSnippet, scan.Hash);
+            MethodCallsFound++;
+        }
 
-        return skipClasses.Contains(className) || skipMethods.Contains(methodName);
+        _fileHashes[scan.FilePath] = scan.Hash;
+        FilesAnalyzed++;
+    }
+
+    // Compiled once and shared across files (and the parallel scan); Regex is thread-safe for matching
+    private static readonly Regex MethodDeclPattern = new(
+        @"(?:public|private|protected|internal)\s+(?:static\s+)?(?:virtual\s+)?(?:override\s+)?(?:async\s+)?(?:\w+(?:<[^>]+>)?)\s+(\w+)\s*\(",
+        RegexOptions.Compiled);
+
+    // Static method calls: ClassName.MethodName(
+    private static readonly Regex StaticCallPattern = new(
+        @"([A-Z]\w+)\.(\w+)\s*\(",
+        RegexOptions.Compiled);
+
+    private static readonly Regex ClassNamePattern = new(
+        @"(?:class|struct)\s+(\w+)",
+        RegexOptions.Compiled);
+
+    // Common system/framework calls that aren't interesting; built once, probed per call
+    private static readonly HashSet<string> SkipClasses = new(StringComparer.OrdinalIgnoreCase)
+    {
+        "Console", "Debug", "Log", "String", "Math", "Mathf", "Convert",
+        "int", "float", "double", "bool", "string", "object", "Array",
+        "List", "Dictionary", "HashSet", "StringBuilder", "Regex",
+        "Path", "File", "Directory", "Environment", "Type", "Activator"
+    };
+
+    private static readonly HashSet<string> SkipMethods = new(StringComparer.OrdinalIgnoreCase)
+    {
+        "ToString", "GetType", "Equals", "GetHashCode", "CompareTo",
+        "Parse", "TryParse", "Format", "Join", "Split", "Contains",
+        "Add", "Remove", "Clear", "Count", "Length"
+    };
+
+    private static bool IsCommonFalsePositive(string className, string methodName)
+    {
+        return SkipClasses.Contains(className) || SkipMethods.Contains(methodName);
     }
 
     private static string ExtractClassName(string content)
     {
-        var match = Regex.Match(content, @"(?:class|struct)\s+(\w+)");
+        var match = ClassNamePattern.Match(content);
         return match.Success ? match.Groups[1].Value : "Unknown";
     }
 
@@ -124,6 +124,22 @@ public class GameCodeIndexer
         FilesProcessed++;
     }
 
+    // Pattern to match class/struct/interface declarations
+    private static readonly Regex ClassPattern = new(
+        @"(?:public|private|protected|internal)?\s*(?:abstract|sealed|static|partial)?\s*" +
+        @"(class|struct|interface)\s+(\w+)(?:<[^>]+>)?\s*" +
+        @"(?::\s*([\w\s,<>\.]+))?\s*(?:where[^{]+)?\s*\{",
+        RegexOptions.Multiline | RegexOptions.Compiled);
+
+    // Pattern to match method declarations
+    private static readonly Regex MethodPattern = new(
+        @"(?:(?:public|private|protected|internal)\s+)?" +
+        @"(?:(static|virtual|override|abstract|sealed|extern|async)\s+)*" +
+        @"([\w<>,\[\]\?]+)\s+" +  // Return type
+        @"(\w+)\s*" +              // Method name
+        @"\(([^)]*)\)",            // Parameters
+        RegexOptions.Multiline | RegexOptions.Compiled);
+
     /// <summary>
     /// Extracts class declarations from source code.
     /// </summary>
@@ -131,14 +147,7 @@ public class GameCodeIndexer
     {
         var classes = new List<ClassInfo>();
 
-        // Pattern to match class/struct/interface declarations
-        var classPattern = new Regex(
-            @"(?:public|private|protected|internal)?\s*(?:abstract|sealed|static|partial)?\s*" +
-            @"(class|struct|interface)\s+(\w+)(?:<[^>]+>)?\s*" +
-            @"(?::\s*([\w\s,<>\.]+))?\s*(?:where[^{]+)?\s*\{",
-            RegexOptions.Multiline);
-
-        foreach (Match match in classPattern.Matches(content))
+        foreach (Match match in ClassPattern.Matches(content))
         {
             var kind = match.Groups[1].Value;
             var className = match.Groups[2].Value;
@@ -204,16 +213,7 @@ public class GameCodeIndexer
         if (string.IsNullOrEmpty(classBody))
             return methods;
 
-        // Pattern to match method declarations
-        var methodPattern = new Regex(
-            @"(?:(?:public|private|protected|internal)\s+)?" +
-            @"(?:(static|virtual|override|abstract|sealed|extern|async)\s+)*" +
-            @"([\w<>,\[\]\?]+)\s+" +  // Return type
-            @"(\w+)\s*" +              // Method name
-            @"\(([^)]*)\)",            // Parameters
-            RegexOptions.Multiline);
-
-        foreach (Match match in methodPattern.Matches(classBody))
+        foreach (Match match in MethodPattern.Matches(classBody))
         {
             var modifiers = match.Groups[1].Captures.Cast<Capture>().Select(c => c.Value).ToList();
             var returnType = match.Groups[2].Value;
@@ -284,7 +284,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 lineNumber = a.LineNumber
             })
         });
-        return JsonSerializer.Serialize(items, new JsonSerializerOptions { WriteIndented = false });
+        return JsonSerializer.Serialize(items);
     }
 
     private static string GeneratePropertyConflictJson(List<PropertyConflict> conflicts)
@@ -296,6 +296,6 @@ document.addEventListener('DOMContentLoaded', () => {
             propertyName = c.PropertyName,
             setters = c.Setters.Select(s => new { modName = s.ModName, value = s.Value })
         });
-        return JsonSerializer.Serialize(items, new JsonSerializerOptions { WriteIndented = false });
+        return JsonSerializer.Serialize(items);
     }
 }
@@ -258,6 +258,6 @@ document.addEventListener('DOMContentLoaded', () => {
                 })
             };
         });
-        return JsonSerializer.Serialize(items, new JsonSerializerOptions { WriteIndented = false });
+        return JsonSerializer.Serialize(items);
     }
 }
@@ -287,7 +287,7 @@ document.addEventListener('DOMContentLoaded', () => {
             refs = e.ReferenceCount,
             properties = e.Properties?.Select(p => new { name = p.Name, value = p.Value, @class = p.Class })
         });
-        return JsonSerializer.Serialize(items, new JsonSerializerOptions { WriteIndented = false });
+        return JsonSerializer.Serialize(items);
     }
 
     private static string GenerateReferenceJson(List<ReferenceExport> refs)
@@ -300,6 +300,6 @@ document.addEventListener('DOMContentLoaded', () => {
             targetName = r.TargetName,
             context = r.Context
         });
-        return JsonSerializer.Serialize(items, new JsonSerializerOptions { WriteIndented = false });
+        return JsonSerializer.Serialize(items);
     }
 }
@@ -2,6 +2,8 @@ using System;
 using System.Collections.Generic;
 using System.IO;
 using System.Linq;
+using System.Text.Encodings.Web;
+using System.Text.Json;
 using Microsoft.Data.Sqlite;
 using XmlIndexer.Models;
 
@@ -190,49 +192,69 @@ All C# mod dependencies are satisfied.")}
 
     public static void GenerateJsonExport(string path, ReportData data)
     {
-        var sb = new System.Text.StringBuilder();
-        sb.AppendLine("{");
-        sb.AppendLine($@"  ""generated"": ""{DateTime.Now:O}"",");
-        sb.AppendLine($@"  ""baseGame"": {{");
-        sb.AppendLine($@"    ""totalDefinitions"": {data.TotalDefinitions},");
-        sb.AppendLine($@"    ""totalProperties"": {data.TotalProperties},");
-        sb.AppendLine($@"    ""totalReferences"": {data.TotalReferences},");
-        sb.AppendLine($@"    ""definitionsByType"": {{");
-        sb.AppendLine(string.Join(",\n", data.DefinitionsByType.Select(kv => $@"      ""{kv.Key}"": {kv.Value}")));
-        sb.AppendLine("    }");
-        sb.AppendLine("  },");
-        sb.AppendLine($@"  ""mods"": {{");
-        sb.AppendLine($@"    ""total"": {data.TotalMods},");
-        sb.AppendLine($@"    ""xmlOnly"": {data.XmlMods},");
-        sb.AppendLine($@"    ""csharpOnly"": {data.CSharpMods},");
-        sb.AppendLine($@"    ""hybrid"": {data.HybridMods},");
-        sb.AppendLine($@"    ""operationsByType"": {{");
-        sb.AppendLine(string.Join(",\n", data.OperationsByType.Select(kv => $@"      ""{kv.Key}"": {kv.Value}")));
-        sb.AppendLine("    },");
-        sb.AppendLine($@"    ""list"": [");
-        sb.AppendLine(string.Join(",\n", data.ModSummary.Select(m => 
-            $@"      {{ ""name"": ""{EscapeJson(m.Name)}"", ""type"": ""{m.ModType}"", ""health"": ""{m.Health}"", ""notes"": ""{EscapeJson(m.HealthNote)}"" }}")));
-        sb.AppendLine("    ]");
-        sb.AppendLine("  },");
-        sb.AppendLine($@"  ""ecosystem"": {{");
-        sb.AppendLine($@"    ""activeEntities"": {data.ActiveEntities},");
-        sb.AppendLine($@"    ""modifiedEntities"": {data.ModifiedEntities},");
-        sb.AppendLine($@"    ""removedEntities"": {data.RemovedEntities},");
-        sb.AppendLine($@"    ""dependedEntities"": {data.DependedEntities},");
-        sb.AppendLine($@"    ""criticalConflicts"": [");
-        sb.AppendLine(string.Join(",\n", data.DangerZone.Select(d => 
-            $@"      {{ ""type"": ""{d.Type}"", ""name"": ""{EscapeJson(d.Name)}"", ""removedBy"": ""{EscapeJson(d.RemovedBy)}"", ""neededBy"": ""{EscapeJson(d.DependedBy)}"" }}")));
-        sb.AppendLine("    ]");
-        sb.AppendLine("  }");
-        sb.AppendLine("}");
-
-        File.WriteAllText(path, sb.ToString());
+        // Stream straight to the file; the report is never held as one big string
+        using var stream = new FileStream(path, FileMode.Create, FileAccess.Write, FileShare.None, 1 << 16);
+        using var json = new Utf8JsonWriter(stream, new JsonWriterOptions
+        {
+            Indented = true,
+            Encoder = JavaScriptEncoder.UnsafeRelaxedJsonEscaping
+        });
+
+        json.WriteStartObject();
+        json.WriteString("generated", DateTime.Now);
+
+        json.WriteStartObject("baseGame");
+        json.WriteNumber("totalDefinitions", data.TotalDefinitions);
+        json.WriteNumber("totalProperties", data.TotalProperties);
+        json.WriteNumber("totalReferences", data.TotalReferences);
+        WriteCounts(json, "definitionsByType", data.DefinitionsByType);
+        json.WriteEndObject();
+
+        json.WriteStartObject("mods");
+        json.WriteNumber("total", data.TotalMods);
+        json.WriteNumber("xmlOnly", data.XmlMods);
+        json.WriteNumber("csharpOnly", data.CSharpMods);
+        json.WriteNumber("hybrid", data.HybridMods);
+        WriteCounts(json, "operationsByType", data.OperationsByType);
+        json.WriteStartArray("list");
+        foreach (var m in data.ModSummary)
+        {
+            json.WriteStartObject();
+            json.WriteString("name", m.Name);
+            json.WriteString("type", m.ModType);
+            json.WriteString("health", m.Health);
+            json.WriteString("notes", m.HealthNote);
+            json.WriteEndObject();
+        }
+        json.WriteEndArray();
+        json.WriteEndObject();
+
+        json.WriteStartObject("ecosystem");
+        json.WriteNumber("activeEntities", data.ActiveEntities);
+        json.WriteNumber("modifiedEntities", data.ModifiedEntities);
+        json.WriteNumber("removedEntities", data.RemovedEntities);
+        json.WriteNumber("dependedEntities", data.DependedEntities);
+        json.WriteStartArray("criticalConflicts");
+        foreach (var d in data.DangerZone)
+        {
+            json.WriteStartObject();
+            json.WriteString("type", d.Type);
+            json.WriteString("name", d.Name);
+            json.WriteString("removedBy", d.RemovedBy);
+            json.WriteString("neededBy", d.DependedBy);
+            json.WriteEndObject();
+        }
+        json.WriteEndArray();
+        json.WriteEndObject();
+
+        json.WriteEndObject();
     }
 
-    private static string EscapeJson(string s) => s
-        .Replace("\\", "\\\\")
-        .Replace("\"", "\\\"")
-        .Replace("\n", "\\n")
-        .Replace("\r", "\\r")
-        .Replace("\t", "\\t");
+    private static void WriteCounts(Utf8JsonWriter json, string name, Dictionary<string, int> counts)
+    {
+        json.WriteStartObject(name);
+        foreach (var (key, value) in counts)
+            json.WriteNumber(key, value);
+        json.WriteEndObject();
+    }
 }
@@ -522,6 +522,6 @@ document.addEventListener('DOMContentLoaded', () => {{
             };
         });
 
-        return JsonSerializer.Serialize(items, new JsonSerializerOptions { WriteIndented = false });
+        return JsonSerializer.Serialize(items);
     }
 }
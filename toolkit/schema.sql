@@ -61,8 +61,9 @@ CREATE TABLE IF NOT EXISTS calls (
     FOREIGN KEY (callee_id) REFERENCES methods(id)
 );
 
-CREATE INDEX IF NOT EXISTS idx_calls_caller ON calls(caller_id);
-CREATE INDEX IF NOT EXISTS idx_calls_callee ON calls(callee_id);
+-- Composite so edge scans (caller_id, callee_id) are answered from the index alone
+CREATE INDEX IF NOT EXISTS idx_calls_caller_callee ON calls(caller_id, callee_id);
+CREATE INDEX IF NOT EXISTS idx_calls_callee_caller ON calls(callee_id, caller_id);
 
 -- Interface implementations
 CREATE TABLE IF NOT EXISTS implements (
@@ -340,7 +341,9 @@ CREATE TABLE IF NOT EXISTS harmony_patches (
 
 CREATE INDEX IF NOT EXISTS idx_patches_mod ON harmony_patches(mod_id);
 CREATE INDEX IF NOT EXISTS idx_patches_modname ON harmony_patches(mod_name);
-CREATE INDEX IF NOT EXISTS idx_patches_target ON harmony_patches(target_type, target_method);
+-- Covers the compat GROUP BY target + DISTINCT mod_name/patch_type aggregates
+-- (mod_name is filled from the mod link by the extractor)
+CREATE INDEX IF NOT EXISTS idx_patches_target_mod ON harmony_patches(target_type, target_method, mod_name, patch_type);
 CREATE INDEX IF NOT EXISTS idx_patches_game_method ON harmony_patches(game_method_id);
 
 -- ============================================================================
@@ -365,7 +368,8 @@ CREATE TABLE IF NOT EXISTS xml_changes (
 
 CREATE INDEX IF NOT EXISTS idx_xml_mod ON xml_changes(mod_id);
 CREATE INDEX IF NOT EXISTS idx_xml_modname ON xml_changes(mod_name);
-CREATE INDEX IF NOT EXISTS idx_xml_target ON xml_changes(file_name, xpath);
+-- Covers the compat GROUP BY file/xpath + DISTINCT mod_name/operation aggregates
+CREATE INDEX IF NOT EXISTS idx_xml_target_mod ON xml_changes(file_name, xpath, mod_name, operation);
 CREATE INDEX IF NOT EXISTS idx_xml_def ON xml_changes(xml_def_id);
 
 -- ============================================================================